@@ -21,16 +21,29 @@
 )
 
 
+import functools
 import importlib.metadata
 
 
-def retrieve_package_metadata(item: str, default: str) -> str:
+# The package metadata is only read (and parsed) once, however many items are retrieved.
+#
+@functools.lru_cache(maxsize=None)
+def load_package_metadata() -> typing.Optional[typing.Mapping[str, str]]:
     try:
-        return importlib.metadata.metadata(__package__).get(item, default)
+        return importlib.metadata.metadata(__package__)
 
     except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def retrieve_package_metadata(item: str, default: str) -> str:
+    metadata: typing.Optional[typing.Mapping[str, str]] = load_package_metadata()
+
+    if metadata is None:
         return default
 
+    return metadata.get(item, default)
+
 
 __version__: str = retrieve_package_metadata("Version", "0.2.0")
 
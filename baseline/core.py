@@ -15,24 +15,46 @@
 
 import concurrent.futures
 import concurrent.futures.process
+import dataclasses
+import functools
+import itertools
 import logging
 import logging.config
-import operator
+import multiprocessing
 import os
 import pathlib
+import queue
 import signal
+import stat
 import sys
 import types
 import typing
-import warnings
 
 import magic
-import pydantic
 
 from baseline import errors, extractors, models, schema
 
 __all__: typing.Tuple[str, ...] = ("Baseline",)
 
+_MODE_TO_KIND: typing.Dict[int, int] = {
+    stat.S_IFBLK: models.Kind.BLOCK_DEVICE,
+    stat.S_IFCHR: models.Kind.CHARACTER_DEVICE,
+    stat.S_IFDIR: models.Kind.DIRECTORY,
+    stat.S_IFIFO: models.Kind.FIFO,
+    stat.S_IFLNK: models.Kind.SYMLINK,
+    stat.S_IFREG: models.Kind.FILE,
+    stat.S_IFSOCK: models.Kind.SOCKET,
+}
+
+_MAGIC_DESCRIPTION: typing.Optional[magic.Magic] = None
+_MAGIC_MIME: typing.Optional[magic.Magic] = None
+
+# Queue shared by the worker processes to stream the analyzed records back to the parent
+# process. Items are tagged with the identifier of the `Baseline.compute` call they belong to,
+# and a `None` record marks the end of a partition.
+#
+_RESULTS: typing.Optional[multiprocessing.Queue] = None
+
 
 def teardown_worker(sig: int, _: typing.Optional[typing.Any] = None) -> None:
     logger: logging.Logger = logging.getLogger(__name__)
@@ -45,95 +67,194 @@ def teardown_worker(sig: int, _: typing.Optional[typing.Any] = None) -> None:
     sys.exit(os.EX_SOFTWARE)
 
 
-def initialize_worker() -> None:
+def initialize_magic() -> None:
+    global _MAGIC_DESCRIPTION, _MAGIC_MIME
+
+    # The libmagic database is loaded once per process, and the handles are reused for every
+    # analyzed entry.
+    #
+    _MAGIC_DESCRIPTION = magic.Magic(mime=False)
+    _MAGIC_MIME = magic.Magic(mime=True)
+
+
+# Identical headers (e.g. empty files or copies of the same template) are common, so the
+# classification of recent headers is cached instead of querying libmagic again.
+#
+@functools.lru_cache(maxsize=4096)
+def _classify_header(header: bytes) -> typing.Tuple[str, str]:
+    return _MAGIC_DESCRIPTION.from_buffer(header), _MAGIC_MIME.from_buffer(header)
+
+
+def initialize_worker(results: typing.Optional[multiprocessing.Queue] = None) -> None:
+    global _RESULTS
+
     signal.signal(signal.SIGINT, teardown_worker)
 
+    initialize_magic()
 
-def gather_filesystem_entries(
-    root: pathlib.Path,
-    exclude_directory: typing.List[pathlib.Path] = [],
-    max_size: typing.Optional[int] = None,
+    # The records that are still buffered when the worker exits (i.e. when the pool is shut down
+    # before they are read) are dropped, so that the worker does not wait for the parent process
+    # to read them.
+    #
+    if results is not None:
+        results.cancel_join_thread()
+
+    _RESULTS = results
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_strict_cached(location: str) -> pathlib.Path:
+    return pathlib.Path(location).resolve(strict=True)
+
+
+def _resolve_strict(location: typing.Union[str, pathlib.Path]) -> pathlib.Path:
+    # Resolving a path issues one `lstat` per component, and the same locations are usually
+    # given again on each call to `Baseline.compute`.
+    #
+    return _resolve_strict_cached(str(location))
+
+
+def _scandir_recursive(
+    location: str,
+    excluded_prefixes: typing.Tuple[str, ...] = (),
     recursive: bool = True,
-    skip_directories: bool = False,
-    skip_empty: bool = False,
-) -> typing.Tuple[pathlib.Path, typing.List[typing.Tuple[pathlib.Path, int]]]:
+) -> typing.Iterator[typing.Tuple[os.DirEntry, int]]:
     logger: logging.Logger = logging.getLogger(__name__)
 
-    logger.debug(
-        "Gathering files %sfrom root location `%s`.",
-        "recursively " if recursive else "",
-        root,
-    )
+    with os.scandir(location) as iterator:
+        for entry in iterator:
+            if entry.path.startswith(excluded_prefixes):
+                logger.debug("Ignoring entry `%s` from an excluded directory.", entry.path)
 
-    results: typing.List[typing.Tuple[pathlib.Path, int]] = []
+                continue
 
-    try:
-        for entry in root.glob("*") if not recursive else root.rglob("*"):
-            for directory in exclude_directory:
-                if directory in entry.parents:
-                    logger.debug(
-                        "Ignoring entry `%s` from excluded directory `%s`.", entry, directory
-                    )
+            # The type of the entry is retrieved from the cached `d_type` returned by the
+            # directory listing whenever possible, so that only special files need an extra
+            # `lstat` call.
+            #
+            if entry.is_symlink():
+                kind: int = models.Kind.SYMLINK
 
-                    continue
+            elif entry.is_dir(follow_symlinks=False):
+                kind: int = models.Kind.DIRECTORY
 
-            if entry.is_file():
+            elif entry.is_file(follow_symlinks=False):
                 kind: int = models.Kind.FILE
 
-            elif entry.is_dir():
-                if skip_directories:
-                    logger.debug(
-                        "Skipping directory `%s` because of the `--skip-directories` flag.",
-                        entry,
+            else:
+                try:
+                    mode: int = entry.stat(follow_symlinks=False).st_mode
+
+                except PermissionError:
+                    logger.warning(
+                        "Failed to access entry `%s` because of insufficient permissions. "
+                        "Skipping.",
+                        entry.path,
                     )
 
                     continue
 
-                kind: int = models.Kind.DIRECTORY
+                except FileNotFoundError:
+                    logger.error(
+                        "Cannot access entry `%s` since it does not exist. This can be caused by "
+                        "temporary files that have been unlinked before reaching processing. "
+                        "Skipping.",
+                        entry.path,
+                    )
 
-            elif entry.is_block_device():
-                kind: int = models.Kind.BLOCK_DEVICE
+                    continue
 
-            elif entry.is_char_device():
-                kind: int = models.Kind.CHARACTER_DEVICE
+                kind: int = _MODE_TO_KIND.get(stat.S_IFMT(mode), models.Kind.OTHER)
 
-            elif entry.is_fifo():
-                kind: int = models.Kind.FIFO
+            yield (entry, kind)
 
-            elif entry.is_socket():
-                kind: int = models.Kind.SOCKET
+            if recursive and kind == models.Kind.DIRECTORY:
+                # Excluded subtrees are pruned from the walk instead of being listed and filtered
+                # entry by entry.
+                #
+                if os.path.join(entry.path, "").startswith(excluded_prefixes):
+                    logger.debug("Not descending into excluded directory `%s`.", entry.path)
 
-            elif entry.is_symlink():
-                kind: int = models.Kind.SYMLINK
+                    continue
 
-            elif entry.is_mount():
-                kind: int = models.Kind.MOUNT
+                try:
+                    yield from _scandir_recursive(
+                        entry.path,
+                        excluded_prefixes=excluded_prefixes,
+                    )
 
-            else:
-                kind: int = models.Kind.OTHER
+                except PermissionError:
+                    logger.warning(
+                        "Failed to list directory `%s` because of insufficient permissions. "
+                        "Skipping.",
+                        entry.path,
+                    )
 
-            try:
-                stats = entry.stat(follow_symlinks=kind != models.Kind.SYMLINK)
-
-            except TypeError:
-                if sys.version_info >= (3, 10):
-                    raise
-
-                warnings.warn(
-                    "The `follow_symlinks` parameter was only added to `pathlib.Path.stat` in Python "
-                    "3.10 so it cannot be used with the current installation of Python ("
-                    f"{'.'.join(str(component) for component in sys.version_info[:3])}). Update your "
-                    "installation to remove this warning. Falling back to the old way (following all "
-                    "symlinks)."
+                except FileNotFoundError:
+                    logger.error(
+                        "Cannot list directory `%s` since it does not exist. This can be caused "
+                        "by temporary directories that have been unlinked before reaching "
+                        "processing. Skipping.",
+                        entry.path,
+                    )
+
+
+def gather_filesystem_entries(
+    root: pathlib.Path,
+    exclude_directory: typing.List[pathlib.Path] = [],
+    max_size: typing.Optional[int] = None,
+    recursive: bool = True,
+    skip_directories: bool = False,
+    skip_empty: bool = False,
+) -> typing.Tuple[
+    pathlib.Path, typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]]
+]:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    logger.debug(
+        "Gathering files %sfrom root location `%s`.",
+        "recursively " if recursive else "",
+        root,
+    )
+
+    # `str.startswith` accepts a tuple of prefixes and tests all of them in a single call. The
+    # trailing separator prevents sibling entries sharing the same prefix from being excluded.
+    #
+    excluded_prefixes: typing.Tuple[str, ...] = tuple(
+        os.path.join(directory, "") for directory in exclude_directory
+    )
+
+    results: typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]] = []
+
+    try:
+        for entry, kind in _scandir_recursive(
+            str(root),
+            excluded_prefixes=excluded_prefixes,
+            recursive=recursive,
+        ):
+            if skip_directories and kind == models.Kind.DIRECTORY:
+                logger.debug(
+                    "Skipping directory `%s` because of the `--skip-directories` flag.",
+                    entry.path,
                 )
 
+                continue
+
+            stats: typing.Optional[os.stat_result] = None
+
+            # The size-based filters are the only consumers of the entry metadata during the
+            # gathering phase, so the `lstat` call is only issued when one of them is enabled. Its
+            # result is then handed over to the extractors, which do not need to issue it again.
+            #
+            if skip_empty or max_size:
                 try:
-                    stats = entry.stat()
+                    stats = entry.stat(follow_symlinks=False)
 
                 except PermissionError:
                     logger.warning(
-                        "Failed to access entry `%s` because of insufficient permissions. Skipping.",
-                        entry,
+                        "Failed to access entry `%s` because of insufficient permissions. "
+                        "Skipping.",
+                        entry.path,
                     )
 
                     continue
@@ -141,16 +262,9 @@ def gather_filesystem_entries(
                 except FileNotFoundError:
                     logger.error(
                         "Cannot access entry `%s` since it does not exist. This can be caused by "
-                        "temporary files that have been unlinked before reaching processing. Skipping.",
-                        entry,
-                    )
-
-                    continue
-
-                except RuntimeError:
-                    logger.error(
-                        "Probable infinite loop encountered while accessing entry `%s`. Skipping.",
-                        entry,
+                        "temporary files that have been unlinked before reaching processing. "
+                        "Skipping.",
+                        entry.path,
                     )
 
                     continue
@@ -158,29 +272,30 @@ def gather_filesystem_entries(
                 except Exception:
                     logger.exception(
                         "Unknown system exception raised while accessing entry `%s`. Skipping.",
-                        entry,
+                        entry.path,
                     )
 
                     continue
 
-            if skip_empty and not stats.st_size:
-                logger.debug(
-                    "Skipping empty entry `%s` because of the `--skip-empty` flag.", entry
-                )
+                if skip_empty and not stats.st_size:
+                    logger.debug(
+                        "Skipping empty entry `%s` because of the `--skip-empty` flag.", entry.path
+                    )
 
-                continue
+                    continue
 
-            if max_size and (stats.st_size > max_size):
-                logger.debug(
-                    "Skipping entry `%s` because it exceeds the maximum threshold of `%d` "
-                    "bytes. You can override this threshold using the `--max-size` option.",
-                    entry,
-                    max_size,
-                )
+                if max_size and (stats.st_size > max_size):
+                    logger.debug(
+                        "Skipping entry `%s` because it exceeds the maximum threshold of `%d` "
+                        "bytes. You can override this threshold using the `--max-size` option.",
+                        entry.path,
+                        max_size,
+                    )
 
-                continue
+                    continue
 
-            results.append((entry, kind))
+            # Only the entries that survived all filters are promoted to `pathlib.Path` objects.
+            results.append((pathlib.Path(entry.path), kind, stats))
 
     except PermissionError:
         logger.warning(
@@ -219,18 +334,32 @@ def gather_filesystem_entries(
     return (root, results)
 
 
-def process_partition(
-    partition: typing.List[typing.Tuple[pathlib.Path, int]],
+def analyze_partition(
+    partition: typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]],
     exclude_extractor: typing.List[str],
     remap: typing.Dict[pathlib.Path, pathlib.Path],
     magic_bytes_lookahead: int = 1024,
-) -> typing.List[schema.Record]:
+) -> typing.Iterator[schema.Record]:
     logger: logging.Logger = logging.getLogger(__name__)
     logger.debug("Analyzing `%d` entries.", len(partition))
 
-    records: typing.List[schema.Record] = []
+    if _MAGIC_DESCRIPTION is None or _MAGIC_MIME is None:
+        initialize_magic()
 
-    for entry, kind in partition:
+    # Extractors are indexed by the kinds of entries they declare to support, so that the
+    # ones that cannot apply to an entry are never considered.
+    #
+    selected_extractors: typing.Dict[
+        models.Kind,
+        typing.Tuple[models.Extractor, ...],
+    ] = extractors.map_extractors(exclude=exclude_extractor)
+
+    supported_extractors: typing.Dict[
+        typing.Tuple[int, str, typing.Optional[str]],
+        typing.Tuple[models.Extractor, ...],
+    ] = {}
+
+    for entry, kind, stats in partition:
         magic_signature: typing.Optional[str] = None
         mime_type: typing.Optional[str] = None
 
@@ -239,11 +368,18 @@ def process_partition(
             models.Kind.BLOCK_DEVICE,
         ):
             try:
-                with entry.open("rb") as stream:
-                    header: bytes = stream.read(magic_bytes_lookahead)
+                # libmagic only needs the first bytes of the entry, which are read without
+                # allocating a buffered stream.
+                #
+                descriptor: int = os.open(entry, os.O_RDONLY)
+
+                try:
+                    header: bytes = os.pread(descriptor, magic_bytes_lookahead, 0)
 
-                    magic_signature = magic.from_buffer(header)
-                    mime_type = magic.from_buffer(header, mime=True)
+                finally:
+                    os.close(descriptor)
+
+                magic_signature, mime_type = _classify_header(header)
 
             except PermissionError:
                 logger.error(
@@ -279,61 +415,160 @@ def process_partition(
 
                 continue
 
-        record: schema.Record = schema.Record(
-            signature=schema.Signature(
+        # The signature only holds values computed above, which do not need to be validated
+        # again, so the record is built without going through the pydantic validators.
+        #
+        record: schema.Record = schema.Record.construct(
+            signature=schema.Signature.construct(
                 kind=str(kind),
                 magic=magic_signature,
                 mime=mime_type,
             ),
         )
 
-        for extractor in extractors.iterate_extractors(exclude=exclude_extractor):
-            if extractor.supports(entry, kind=kind, magic_signature=magic_signature):
-                try:
-                    module: models.Extractor = extractor(entry, remap=remap)
-                    module.run(record)
+        suffix: str = entry.suffix
 
-                    logger.debug("Merged output from extractor `%s`.", extractor.KEY)
+        # Whether an extractor supports an entry only depends on its kind, suffix and magic
+        # signature, which are shared by many entries. The filters of all the extractors are thus
+        # only evaluated once for every combination of them.
+        #
+        key: typing.Tuple[int, str, typing.Optional[str]] = (kind, suffix, magic_signature)
+        candidates: typing.Optional[typing.Tuple[models.Extractor, ...]]
+        candidates = supported_extractors.get(key)
+
+        if candidates is None:
+            candidates = supported_extractors[key] = tuple(
+                extractor
+                for extractor in selected_extractors.get(kind, ())
+                if extractor.supports(
+                    entry,
+                    kind=kind,
+                    magic_signature=magic_signature,
+                    suffix=suffix,
+                )
+            )
 
-                except errors.GenericError:
-                    logger.error(
-                        "Failed to extract information from entry `%s` (%s) because of an "
-                        "exception in extractor `%s`.",
-                        entry,
-                        str(kind),
-                        extractor.KEY,
-                    )
+        for extractor in candidates:
+            try:
+                module: models.Extractor = extractor(
+                    entry,
+                    kind=kind,
+                    remap=remap,
+                    stats=stats,
+                )
+                module.run(record)
 
-                except Exception:
-                    logger.exception(
-                        "Failed to extract information from entry `%s` (%s) because of an "
-                        "unrecoverable exception in extractor `%s`.",
-                        entry,
-                        str(kind),
-                        extractor.KEY,
-                    )
+                logger.debug("Merged output from extractor `%s`.", extractor.KEY)
+
+            except errors.GenericError:
+                logger.error(
+                    "Failed to extract information from entry `%s` (%s) because of an "
+                    "exception in extractor `%s`.",
+                    entry,
+                    str(kind),
+                    extractor.KEY,
+                )
+
+            except Exception:
+                logger.exception(
+                    "Failed to extract information from entry `%s` (%s) because of an "
+                    "unrecoverable exception in extractor `%s`.",
+                    entry,
+                    str(kind),
+                    extractor.KEY,
+                )
+
+        yield record
 
-        records.append(record)
 
-    return records
+def process_partition(
+    partition: typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]],
+    exclude_extractor: typing.List[str],
+    remap: typing.Dict[pathlib.Path, pathlib.Path],
+    magic_bytes_lookahead: int = 1024,
+) -> typing.List[schema.Record]:
+    return list(
+        analyze_partition(
+            partition,
+            exclude_extractor=exclude_extractor,
+            remap=remap,
+            magic_bytes_lookahead=magic_bytes_lookahead,
+        ),
+    )
+
+
+def stream_partition(
+    call: int,
+    partition: typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]],
+    **kwargs: typing.Any,
+) -> int:
+    # Unlike `process_partition`, the records are not returned but streamed to the parent process
+    # as soon as they are complete, through the queue set by `initialize_worker`. Only the number
+    # of records is returned.
+    #
+    if _RESULTS is None:
+        raise errors.GenericError("worker process initialized without a results queue")
 
+    count: int = 0
 
-class BaselineAttributes(pydantic.BaseModel):
+    for record in analyze_partition(partition, **kwargs):
+        _RESULTS.put((call, record))
+
+        count += 1
+
+    _RESULTS.put((call, None))
+
+    return count
+
+
+@dataclasses.dataclass(frozen=True)
+class BaselineAttributes:
     comment: typing.Optional[str]
-    exclude_directory: typing.List[pydantic.DirectoryPath]
+    exclude_directory: typing.List[pathlib.Path]
     exclude_extractor: typing.List[str]
-    include: typing.List[pathlib.Path] = []
     max_size: int
-    partition_size: int
-    processes: int = os.cpu_count() or 1
+    partition_size: typing.Optional[int]
     recursive: bool
-    remap: typing.Dict[pydantic.DirectoryPath, pathlib.Path]
+    remap: typing.Dict[pathlib.Path, pathlib.Path]
     skip_compression: bool
     skip_directories: bool
     skip_empty: bool
+    include: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+    processes: int = os.cpu_count() or 1
 
-    class Config:
-        allow_mutation = False
+    def __post_init__(self: object) -> None:
+        self._validate()
+
+    def _validate(self: object) -> None:
+        outliers: typing.List[str] = [
+            name
+            for name, optional, minimum in (
+                ("max_size", False, 0),
+                ("partition_size", True, 1),
+                ("processes", False, 1),
+            )
+            if not (optional and getattr(self, name) is None)
+            and (not isinstance(getattr(self, name), int) or getattr(self, name) < minimum)
+        ]
+
+        # Excluded and remapped locations must be existing directories, whereas included ones
+        # can be any existing entry.
+        #
+        for name, locations, predicate in (
+            ("exclude_directory", self.exclude_directory, os.path.isdir),
+            ("include", self.include, os.path.lexists),
+            ("remap", self.remap, os.path.isdir),
+        ):
+            if not all(predicate(location) for location in locations):
+                outliers.append(name)
+
+        if outliers:
+            raise errors.ValidationError(
+                "validation error in class attributes",
+                context={
+                    "parameters": outliers,
+                },
+            )
 
 
 class Baseline:
@@ -343,7 +578,7 @@ def __init__(
         exclude_directory: typing.List[typing.Union[str, pathlib.Path]] = [],
         exclude_extractor: typing.List[str] = [],
         max_size: int = 5000000,
-        partition_size: int = 200,
+        partition_size: typing.Optional[int] = None,
         processes: int = os.cpu_count() or 1,
         recursive: bool = True,
         remap: typing.Dict[typing.Union[str, pathlib.Path], typing.Union[str, pathlib.Path]] = {},
@@ -359,16 +594,14 @@ def __init__(
         try:
             self.parameters: BaselineAttributes = BaselineAttributes(
                 comment=comment,
-                exclude_directory=[
-                    pathlib.Path(location).resolve(strict=True) for location in exclude_directory
-                ],
+                exclude_directory=[_resolve_strict(location) for location in exclude_directory],
                 exclude_extractor=exclude_extractor,
                 max_size=max_size,
                 partition_size=partition_size,
                 processes=processes,
                 recursive=recursive,
                 remap={
-                    pathlib.Path(source).resolve(strict=True): pathlib.Path(destination).resolve()
+                    _resolve_strict(source): pathlib.Path(destination).resolve()
                     for source, destination in remap.items()
                 },
                 skip_compression=skip_compression,
@@ -379,28 +612,37 @@ def __init__(
         except FileNotFoundError as exception:
             raise errors.GenericError(f"entry `{exception.filename}` not found") from exception
 
-        except pydantic.ValidationError as exception:
-            outliers: typing.List[str] = list(
-                map(operator.itemgetter(0), (map(operator.itemgetter("loc"), exception.errors()))),
-            )
-
+        except errors.ValidationError as exception:
             self.logger.exception(
                 "Validation error in the `%s` class attributes `%s`.",
                 __name__,
-                ", ".join(outliers),
+                ", ".join(exception.context.get("parameters", [])),
             )
 
-            raise errors.ValidationError(
-                "validation error in class attributes",
-                context={
-                    "parameters": outliers,
-                },
-            ) from exception
+            raise
+
+        # The extractors are selected before the worker processes are started, so that they
+        # inherit the selection and the disabled extractors are only reported once.
+        #
+        extractors.map_extractors(exclude=self.parameters.exclude_extractor)
+
+        # Gathering is bound by filesystem syscalls that release the GIL, so it runs on threads
+        # and its results stay in the current process. Analysis runs libmagic and the
+        # extractors, which benefit from actual parallelism.
+        #
+        self.gather_pool: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, 4 * self.parameters.processes),
+            )
+        )
+
+        self.results: multiprocessing.Queue = multiprocessing.Queue()
 
         try:
-            self.pool: concurrent.futures.ProcessPoolExecutor = (
+            self.analysis_pool: concurrent.futures.ProcessPoolExecutor = (
                 concurrent.futures.ProcessPoolExecutor(
                     initializer=initialize_worker,
+                    initargs=(self.results,),
                     max_workers=self.parameters.processes,
                 )
             )
@@ -417,10 +659,15 @@ def __init__(
 
             raise errors.GenericError("process pool shut down abruptly") from exception
 
-        self.futures: typing.Dict[str, typing.Set[concurrent.futures.Future]] = {
-            "gathering": set(),
-            "analysis": set(),
-        }
+        self.futures: typing.Set[concurrent.futures.Future] = set()
+
+        # Analysis futures are not retained once submitted: their failures are reported here by
+        # a done-callback, so that the futures and their results can be released right away.
+        # Like the records, failures are tagged with the identifier of the call they belong to.
+        #
+        self.failures: "queue.Queue[typing.Tuple[int, BaseException]]" = queue.Queue()
+
+        self.calls: typing.Iterator[int] = itertools.count()
 
     def _split_partitions(
         self: object,
@@ -431,6 +678,86 @@ def _split_partitions(
         for index in range(0, len(items), count):
             yield items[index : index + count]
 
+    def _submit_partitions(
+        self: object,
+        call: int,
+        root: pathlib.Path,
+        entries: typing.List[typing.Tuple[pathlib.Path, int, typing.Optional[os.stat_result]]],
+        parameters: BaselineAttributes,
+        analysis: typing.Set[concurrent.futures.Future],
+    ) -> int:
+        total: int = len(entries)
+
+        if not total:
+            self.logger.info(
+                "No entries gathered from root location `%s`. " "Skipping.",
+                root,
+            )
+
+            return 0
+
+        # Unless explicitly set, the partition size is adapted to the number of gathered entries
+        # so that each worker process receives about four partitions.
+        #
+        partition_size: int = parameters.partition_size or max(
+            16,
+            min(512, total // (parameters.processes * 4)),
+        )
+
+        self.logger.info(
+            "Partitioning a total of `%d` entries from root location "
+            "`%s` with a rate of `%d` entries per process (ratio `%.1f`).",
+            total,
+            root,
+            partition_size,
+            float(total) / float(partition_size),
+        )
+
+        count: int = 0
+
+        # The partitions of a root location are analyzed in the background while the other ones
+        # are still being gathered. The partition size is already adapted to the number of
+        # entries, so each partition makes up a single work item.
+        #
+        for partition in self._split_partitions(entries, partition_size):
+            future: concurrent.futures.Future = self.analysis_pool.submit(
+                stream_partition,
+                call,
+                partition,
+                exclude_extractor=parameters.exclude_extractor,
+                remap=parameters.remap,
+            )
+
+            analysis.add(future)
+            self.futures.add(future)
+
+            future.add_done_callback(functools.partial(self._collect_failure, call, analysis))
+
+            count += 1
+
+        return count
+
+    def _collect_failure(
+        self: object,
+        call: int,
+        analysis: typing.Set[concurrent.futures.Future],
+        future: concurrent.futures.Future,
+    ) -> None:
+        analysis.discard(future)
+        self.futures.discard(future)
+
+        if not future.cancelled() and future.exception() is not None:
+            self.failures.put((call, future.exception()))
+
+    def _raise_failure(self: object, call: int) -> None:
+        # Failures of previous calls (e.g. whose iteration has been stopped early) are discarded.
+        #
+        while not self.failures.empty():
+            origin, exception = self.failures.get()
+
+            if origin == call:
+                raise exception
+
     def __enter__(self: object) -> object:
         return self
 
@@ -450,12 +777,16 @@ def __exit__(
                 self._panic,
             )(kind, value, traceback)
 
-        self.pool.shutdown()
+        self.gather_pool.shutdown(cancel_futures=True)
+        self.analysis_pool.shutdown(cancel_futures=True)
 
-        # Manually close the ProcessPoolExecutor context manager that we opened
-        # in the constructor.
+        # Manually close the executor context managers that we opened in the
+        # constructor.
         #
-        self.pool.__exit__(None, None, None)
+        self.gather_pool.__exit__(None, None, None)
+        self.analysis_pool.__exit__(None, None, None)
+
+        self.results.close()
 
     def _panic(
         self: object,
@@ -466,7 +797,8 @@ def _panic(
         if traceback:
             self.logger.exception("Fatal exception caught.")
 
-            self.pool.shutdown()
+            self.gather_pool.shutdown(cancel_futures=True)
+            self.analysis_pool.shutdown(cancel_futures=True)
 
             raise errors.GenericError("process pool shut down abruptly") from value
 
@@ -477,13 +809,13 @@ def _interrupt(
     ) -> None:
         self.logger.critical("Interrupted by manual user action. Cancelling the current tasks.")
 
-        for group in self.futures.values():
-            for future in group:
-                future.cancel()
+        for future in list(self.futures):
+            future.cancel()
 
         self.logger.info("Waiting for the ongoing tasks to finish properly.")
 
-        self.pool.shutdown()
+        self.gather_pool.shutdown(cancel_futures=True)
+        self.analysis_pool.shutdown(cancel_futures=True)
 
         raise KeyboardInterrupt
 
@@ -504,13 +836,11 @@ def compute(
 
         try:
             if exclude_directory is not None:
-                exclude_directory = [
-                    pathlib.Path(location).resolve(strict=True) for location in exclude_directory
-                ]
+                exclude_directory = [_resolve_strict(location) for location in exclude_directory]
 
             if remap is not None:
                 remap = {
-                    pathlib.Path(source).resolve(strict=True): pathlib.Path(destination).resolve()
+                    _resolve_strict(source): pathlib.Path(destination).resolve()
                     for source, destination in remap.items()
                 }
 
@@ -520,9 +850,10 @@ def compute(
                 comment=comment or self.parameters.comment,
                 exclude_directory=exclude_directory or self.parameters.exclude_directory,
                 exclude_extractor=exclude_extractor or self.parameters.exclude_extractor,
-                include=[pathlib.Path(location).resolve(strict=True) for location in include],
+                include=[_resolve_strict(location) for location in include],
                 max_size=max_size or self.parameters.max_size,
                 partition_size=partition_size or self.parameters.partition_size,
+                processes=self.parameters.processes,
                 recursive=recursive or self.parameters.recursive,
                 remap=remap or self.parameters.remap,
                 skip_compression=skip_compression or self.parameters.skip_compression,
@@ -533,98 +864,113 @@ def compute(
         except FileNotFoundError as exception:
             raise errors.GenericError(f"entry `{exception.filename}` not found") from exception
 
-        except pydantic.ValidationError as exception:
-            outliers: typing.List[str] = list(
-                map(operator.itemgetter(0), (map(operator.itemgetter("loc"), exception.errors()))),
-            )
-
+        except errors.ValidationError as exception:
             self.logger.exception(
                 "Validation error in the `%s` class attributes `%s`.",
                 __name__,
-                ", ".join(outliers),
+                ", ".join(exception.context.get("parameters", [])),
             )
 
-            raise errors.ValidationError(
-                "validation error in class attributes",
-                context={
-                    "parameters": outliers,
-                },
-            ) from exception
-
-        with self.pool as executor:
-            for root in parameters.include:
-                self.futures["gathering"].add(
-                    executor.submit(
-                        gather_filesystem_entries,
-                        root,
-                        exclude_directory=parameters.exclude_directory,
-                        max_size=parameters.max_size,
-                        recursive=parameters.recursive,
-                        skip_directories=parameters.skip_directories,
-                        skip_empty=parameters.skip_empty,
-                    ),
-                )
+            raise
 
-            self.logger.info(
-                "Gathering entries from a total of `%d` root locations.",
-                len(parameters.include),
+        # The pools are kept alive across calls and only shut down by `__exit__`, so that the
+        # worker processes are spawned once per instance.
+        #
+        gatherer: concurrent.futures.ThreadPoolExecutor = self.gather_pool
+
+        # Work items of previous calls may still be running (e.g. when their iteration has been
+        # stopped early), so the items of the current call are told apart by its identifier.
+        #
+        call: int = next(self.calls)
+
+        gathering: typing.Set[concurrent.futures.Future] = {
+            gatherer.submit(
+                gather_filesystem_entries,
+                root,
+                exclude_directory=parameters.exclude_directory,
+                max_size=parameters.max_size,
+                recursive=parameters.recursive,
+                skip_directories=parameters.skip_directories,
+                skip_empty=parameters.skip_empty,
             )
+            for root in parameters.include
+        }
 
-            for future in concurrent.futures.as_completed(self.futures["gathering"]):
-                root, entries = future.result()
+        self.futures.update(gathering)
 
-                self.futures["gathering"].remove(future)
+        self.logger.info(
+            "Gathering entries from a total of `%d` root locations.",
+            len(parameters.include),
+        )
 
-                total: int = len(entries)
+        # Number of partitions that have been submitted but are not fully streamed back yet.
+        pending: int = 0
 
-                if not total:
-                    self.logger.info(
-                        "No entries gathered from root location `%s`. " "Skipping.",
-                        root,
+        # Analysis futures of the current call that are not done yet.
+        analysis: typing.Set[concurrent.futures.Future] = set()
+
+        try:
+            while gathering or pending:
+                # Gathering is only polled while partitions are pending, so that the records
+                # already analyzed keep being streamed in the meantime.
+                #
+                if gathering:
+                    done, gathering = concurrent.futures.wait(
+                        gathering,
+                        timeout=0.05 if pending else None,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
                     )
 
-                    continue
+                    for future in done:
+                        self.futures.remove(future)
 
-                self.logger.info(
-                    "Partitioning a total of `%d` entries from root location "
-                    "`%s` with a rate of `%d` entries per process (ratio `%.1f`).",
-                    total,
-                    root,
-                    parameters.partition_size,
-                    float(total) / float(parameters.partition_size),
-                )
+                        pending += self._submit_partitions(
+                            call,
+                            *future.result(),
+                            parameters,
+                            analysis,
+                        )
 
-                for partition in self._split_partitions(entries, parameters.partition_size):
-                    self.futures["analysis"].add(
-                        executor.submit(
-                            process_partition,
-                            partition,
-                            exclude_extractor=parameters.exclude_extractor,
-                            remap=parameters.remap,
-                        ),
-                    )
+                while pending:
+                    # A failed work item never streams the end of its remaining partitions, so
+                    # its exception is surfaced instead of waiting forever.
+                    #
+                    self._raise_failure(call)
 
-                for future in concurrent.futures.as_completed(self.futures["analysis"]):
-                    records = future.result()
+                    # Records are read without blocking while gathering is ongoing, and the
+                    # gathering futures are looked at again as soon as one of them is done.
+                    #
+                    if gathering and any(future.done() for future in gathering):
+                        break
 
-                    self.futures["analysis"].remove(future)
+                    try:
+                        origin, record = self.results.get(block=not gathering, timeout=1.0)
 
-                    total: int = len(records)
+                    except queue.Empty:
+                        if gathering:
+                            break
 
-                    if not records:
-                        self.logger.info(
-                            "No records to yield. Skipping.",
-                        )
+                        continue
 
+                    if origin != call:
                         continue
 
-                    self.logger.debug(
-                        "Yielding `%d` records from future `%d`.",
-                        total,
-                        hash(future),
-                    )
+                    if record is None:
+                        pending -= 1
+
+                        continue
 
-                    for record in records:
-                        record.comment = parameters.comment
+                    record.comment = parameters.comment
+
+                    yield record
+
+        finally:
+            # When the iteration is stopped early, the roots that are still being gathered and
+            # the partitions that are not being analyzed yet are abandoned. The records of the
+            # current call that are still in flight are discarded by the next calls, or dropped
+            # when the pool is shut down.
+            #
+            for future in gathering | set(analysis):
+                future.cancel()
 
-                        yield record
+            self.futures.difference_update(gathering)
@@ -13,24 +13,79 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import logging
 import typing
 
 from baseline import models
 from baseline.extractors import executables, filesystem
 
-__all__: typing.Tuple[str, ...] = ("iterate_extractors",)
+__all__: typing.Tuple[str, ...] = (
+    "iterate_extractors",
+    "map_extractors",
+)
+
+# The set of extractors cannot change once all the extractor modules have been imported, so
+# their compatibility with the current system is only evaluated (and reported) once.
+#
+@functools.lru_cache(maxsize=None)
+def _compatible_extractors() -> typing.Tuple[models.Extractor, ...]:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    selection: typing.List[models.Extractor] = []
+
+    for extractor in models.Extractor.__subclasses__():
+        if not extractor.is_compatible():
+            logger.warning(
+                "Disabling extractor `%s` since it does not support the current operating "
+                "system. The corresponding fields will be missing from the records.",
+                extractor.KEY,
+            )
+
+            continue
+
+        selection.append(extractor)
+
+    return tuple(selection)
+
+
+@functools.lru_cache(maxsize=None)
+def _select_extractors(exclude: typing.Tuple[str, ...]) -> typing.Tuple[models.Extractor, ...]:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    selection: typing.List[models.Extractor] = []
+
+    for extractor in _compatible_extractors():
+        if extractor.KEY in exclude:
+            logger.debug("Ignoring excluded extractor `%s`.", extractor.KEY)
+
+            continue
+
+        selection.append(extractor)
+
+    return tuple(selection)
 
 
 def iterate_extractors(
     exclude: typing.List[str] = [],
 ) -> typing.Iterator[models.Extractor]:
-    for extractor in models.Extractor.__subclasses__():
-        if extractor.is_compatible:
-            if extractor.KEY in exclude:
-                logger: logging.Logger = logging.getLogger(__name__)
-                logger.debug("Ignoring excluded extractor `%s`.", extractor.KEY)
+    return iter(_select_extractors(tuple(sorted(exclude))))
 
-                continue
 
-            yield extractor
+@functools.lru_cache(maxsize=None)
+def _map_extractors(
+    exclude: typing.Tuple[str, ...],
+) -> typing.Dict[models.Kind, typing.Tuple[models.Extractor, ...]]:
+    mapping: typing.Dict[models.Kind, typing.Tuple[models.Extractor, ...]] = {}
+
+    for extractor in _select_extractors(exclude):
+        for kind in extractor.KINDS:
+            mapping[kind] = mapping.get(kind, ()) + (extractor,)
+
+    return mapping
+
+
+def map_extractors(
+    exclude: typing.List[str] = [],
+) -> typing.Dict[models.Kind, typing.Tuple[models.Extractor, ...]]:
+    return _map_extractors(tuple(sorted(exclude)))
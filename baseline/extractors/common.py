@@ -13,27 +13,148 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import collections
+import io
 import math
+import mmap
+import os
 import typing
 
+import numpy
+
+try:
+    import numba
+
+except ImportError:
+    numba = None
+
 __all__: list = []
 
+MMAP_THRESHOLD: int = 1048576
+STRIPE_COUNT: int = 4
 
-def compute_shannon_entropy(stream: typing.IO[bytes], buffer_size: int = 4096) -> float:
-    entropy: float = 0.0
-    size: int = 0
+# When `numba` is available, the byte histogram is computed by a compiled loop which avoids the
+# temporaries allocated by `numpy.bincount`. The compiled kernel is cached on disk so that it is
+# only built once.
+#
+if numba is not None:
 
-    byte_frequency_counter: collections.Counter = collections.Counter()
+    @numba.njit(cache=True, boundscheck=False)
+    def _count_bytes_compiled(data: numpy.ndarray) -> numpy.ndarray:
+        byte_frequencies: numpy.ndarray = numpy.zeros(256, dtype=numpy.int64)
 
-    while chunk := stream.read(buffer_size):
-        byte_frequency_counter.update(chunk)
-        size += len(chunk)
+        for index in range(data.size):
+            byte_frequencies[data[index]] += 1
+
+        return byte_frequencies
+
+else:
+    _count_bytes_compiled: typing.Optional[typing.Callable[[numpy.ndarray], numpy.ndarray]] = None
+
+
+def advise_sequential(stream: typing.IO[bytes]) -> None:
+    # Hints the kernel that the whole file is about to be read sequentially, so that it starts
+    # prefetching the pages while the first chunks are being processed.
+    #
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    try:
+        descriptor: int = stream.fileno()
+
+        os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+
+    except (AttributeError, io.UnsupportedOperation, OSError):
+        pass
+
+
+def iterate_chunks(
+    stream: typing.IO[bytes],
+    buffer_size: int = 65536,
+    mapping_buffer_size: int = 1048576,
+) -> typing.Iterator[memoryview]:
+    try:
+        descriptor: typing.Optional[int] = stream.fileno()
+
+    except (AttributeError, io.UnsupportedOperation):
+        descriptor: typing.Optional[int] = None
+
+    # Large files are mapped into memory instead of being copied chunk by chunk into userland
+    # buffers, and are yielded as zero-copy views over the mapping. Smaller files are read into
+    # a single reusable buffer. In both cases, each view is released (or overwritten) before the
+    # next one is produced, so it must not be kept by the caller.
+    #
+    if descriptor is not None and os.fstat(descriptor).st_size > MMAP_THRESHOLD:
+        with mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ) as mapping:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+            with memoryview(mapping) as view:
+                for offset in range(0, len(view), mapping_buffer_size):
+                    with view[offset : offset + mapping_buffer_size] as chunk:
+                        yield chunk
+
+        return
 
-    for byte_frequency in byte_frequency_counter.values():
-        byte_probability: float = byte_frequency / size
+    advise_sequential(stream)
 
-        if byte_probability:
-            entropy += -byte_probability * math.log(byte_probability, 2)
+    buffer: bytearray = bytearray(buffer_size)
+
+    with memoryview(buffer) as view:
+        while count := stream.readinto(view):
+            with view[:count] as chunk:
+                yield chunk
+
+
+def count_bytes(data: typing.Union[bytes, bytearray, memoryview, mmap.mmap]) -> numpy.ndarray:
+    values: numpy.ndarray = numpy.frombuffer(data, dtype=numpy.uint8)
+
+    if _count_bytes_compiled is not None:
+        return _count_bytes_compiled(values)
+
+    # Large buffers are counted as several interleaved stripes whose histograms are summed, which
+    # spreads the increments of frequent bytes over independent counters. Below the threshold,
+    # the additional passes cost more than they save.
+    #
+    if values.size >= MMAP_THRESHOLD:
+        return sum(
+            numpy.bincount(values[offset::STRIPE_COUNT], minlength=256)
+            for offset in range(STRIPE_COUNT)
+        )
+
+    return numpy.bincount(values, minlength=256)
+
+
+def compute_entropy(byte_frequencies: numpy.ndarray, size: int) -> float:
+    if not size:
+        return 0.0
+
+    # H = log2(n) - (1 / n) * sum(c * log2(c)) over the non-zero counts, which avoids computing
+    # the probability of each byte value first.
+    #
+    counts: numpy.ndarray = byte_frequencies[byte_frequencies > 0]
+
+    entropy: float = math.log2(size) - float((counts * numpy.log2(counts)).sum()) / size
+
+    # Rounding errors can yield a tiny negative value for single-valued inputs.
+    return max(0.0, round(entropy, 6))
+
+
+def compute_shannon_entropy(
+    stream: typing.Union[bytes, memoryview, typing.IO[bytes]],
+    buffer_size: int = 65536,
+) -> float:
+    # In-memory buffers are viewed without being copied.
+    if isinstance(stream, (bytes, bytearray, memoryview)):
+        byte_frequencies: numpy.ndarray = count_bytes(stream)
+
+        return compute_entropy(byte_frequencies, int(byte_frequencies.sum()))
+
+    byte_frequencies: numpy.ndarray = numpy.zeros(256, dtype=numpy.int64)
+    size: int = 0
+
+    for chunk in iterate_chunks(stream, buffer_size=buffer_size):
+        byte_frequencies += count_bytes(chunk)
+        size += len(chunk)
 
-    return round(entropy, 6)
+    return compute_entropy(byte_frequencies, size)
@@ -13,8 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import io
 import logging
+import os
 import pathlib
 import typing
 
@@ -25,10 +25,14 @@
 
 __all__: typing.Tuple[str, ...] = ("PortableExecutable",)
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class PortableExecutable(models.Extractor):
     """Extracts detailed information from Portable Executable (PE) files."""
 
+    __slots__: typing.Tuple[str, ...] = ("executable",)
+
     EXTENSION_FILTERS = (
         r"\.acm$",
         r"\.ax$",
@@ -46,19 +50,15 @@ class PortableExecutable(models.Extractor):
     KEY = "pe"
     KINDS = (models.Kind.FILE,)
     MAGIC_SIGNATURE_FILTERS = (r"^PE32(\+) executable",)
-    SYSTEM_FILTERS = (r"^Linux$",)
 
     def __init__(
         self: object,
         entry: pathlib.Path,
         kind: int = models.Kind.FILE,
-        remap: typing.Dict[pathlib.Path, pathlib.Path] = {},
+        remap: typing.Optional[typing.Mapping[pathlib.Path, pathlib.Path]] = None,
+        stats: typing.Optional[os.stat_result] = None,
     ) -> None:
-        self.logger = logging.getLogger(__name__)
-
-        self.entry = entry
-        self.kind = kind
-        self.remap = remap
+        super().__init__(entry, kind=kind, remap=remap, stats=stats)
 
         self.executable = None
 
@@ -66,7 +66,7 @@ def __init__(
             self.executable: pefile.PE = pefile.PE(self.entry, fast_load=True)
 
         except pefile.PEFormatError as exception:
-            self.logger.exception(
+            logger.exception(
                 "Failed to load file `%s` (%s).",
                 self.entry,
                 str(self.kind),
@@ -83,99 +83,107 @@ def __del__(self: object) -> None:
             self.executable.close()
 
     def run(self: object, record: schema.Record) -> None:
+        # All the required data directories are parsed in a single pass, the helpers below then
+        # only iterate over the populated entries.
+        #
+        self.executable.parse_data_directories(
+            directories=[
+                pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_EXPORT"],
+                pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_IMPORT"],
+                pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_RESOURCE"],
+            ],
+        )
+
         setattr(
             record,
             self.KEY,
             schema.PortableExecutable(
-                exports=list(self._get_exports(self.executable)),
-                imports=list(self._get_imports(self.executable)),
-                resources=list(self._get_resources(self.executable)),
-                sections=list(self._get_sections(self.executable)),
+                exports=self._get_exports(self.executable),
+                imports=self._get_imports(self.executable),
+                resources=self._get_resources(self.executable),
+                sections=self._get_sections(self.executable),
             ),
         )
 
-    def _get_exports(self: object, executable: pefile.PE) -> typing.Iterator[str]:
-        executable.parse_data_directories(
-            directories=[pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_EXPORT"]],
-        )
-
-        count: int = 0
+    def _get_exports(self: object, executable: pefile.PE) -> typing.Tuple[str, ...]:
+        directory = getattr(executable, "DIRECTORY_ENTRY_EXPORT", None)
 
-        if directory := getattr(executable, "DIRECTORY_ENTRY_EXPORT", None):
-            for entry in directory.symbols:
-                count += 1
-                yield entry.name.decode("utf-8")
+        symbols: typing.List[typing.Any] = directory.symbols if directory else []
 
-        self.logger.debug(
-            "Extracted `%d` exports from Portable Executable file `%s`.",
-            count,
-            self.entry,
+        exports: typing.Tuple[str, ...] = tuple(
+            entry.name.decode("ascii", "replace") for entry in symbols if entry.name
         )
 
-    def _get_imports(self: object, executable: pefile.PE) -> typing.Iterator[str]:
-        executable.parse_data_directories(
-            directories=[pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_IMPORT"]],
-        )
-
-        count: int = 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Extracted `%d` exports from Portable Executable file `%s`.",
+                len(symbols),
+                self.entry,
+            )
 
-        if directory := getattr(executable, "DIRECTORY_ENTRY_IMPORT", None):
-            for table in directory:
-                for entry in table.imports:
-                    count += 1
+        return exports
 
-                    if entry.name:
-                        yield entry.name.decode("utf-8")
+    def _get_imports(self: object, executable: pefile.PE) -> typing.Tuple[str, ...]:
+        directory = getattr(executable, "DIRECTORY_ENTRY_IMPORT", None) or []
 
-        self.logger.debug(
-            "Extracted `%d` imports from Portable Executable file `%s`.",
-            count,
-            self.entry,
+        imports: typing.Tuple[str, ...] = tuple(
+            entry.name.decode("ascii", "replace")
+            for table in directory
+            for entry in table.imports
+            if entry.name
         )
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Extracted `%d` imports from Portable Executable file `%s`.",
+                sum(len(table.imports) for table in directory),
+                self.entry,
+            )
+
+        return imports
+
     def _get_resources(
         self: object,
         executable: pefile.PE,
-    ) -> typing.Iterator[schema.PortableExecutableResource]:
-        executable.parse_data_directories(
-            directories=[pefile.DIRECTORY_ENTRY["IMAGE_DIRECTORY_ENTRY_RESOURCE"]],
-        )
+    ) -> typing.List[schema.PortableExecutableResource]:
+        directory = getattr(executable, "DIRECTORY_ENTRY_RESOURCE", None)
 
-        count: int = 0
-
-        if directory := getattr(executable, "DIRECTORY_ENTRY_RESOURCE", None):
-            for entry in directory.entries:
-                count += 1
+        resources: typing.List[schema.PortableExecutableResource] = [
+            schema.PortableExecutableResource(
+                identifier=entry.id,
+                name=entry.name,
+            )
+            for entry in (directory.entries if directory else [])
+        ]
 
-                yield schema.PortableExecutableResource(
-                    identifier=entry.id,
-                    name=entry.name,
-                )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Extracted `%d` resources from Portable Executable file `%s`.",
+                len(resources),
+                self.entry,
+            )
 
-        self.logger.debug(
-            "Extracted `%d` resources from Portable Executable file `%s`.",
-            count,
-            self.entry,
-        )
+        return resources
 
     def _get_sections(
         self: object,
         executable: pefile.PE,
-    ) -> typing.Iterator[schema.PortableExecutableSection]:
-        count: int = 0
-
-        for section in executable.sections:
-            count += 1
-
-            yield schema.PortableExecutableSection(
-                entropy=common.compute_shannon_entropy(io.BytesIO(section.get_data())),
-                name=section.Name.decode("utf-8").rstrip("\u0000"),
+    ) -> typing.Tuple[schema.PortableExecutableSection, ...]:
+        sections: typing.Tuple[schema.PortableExecutableSection, ...] = tuple(
+            schema.PortableExecutableSection(
+                entropy=common.compute_shannon_entropy(section.get_data()),
+                name=section.Name.rstrip(b"\x00").decode("ascii", "replace"),
                 psize=section.SizeOfRawData,
                 vsize=section.Misc_VirtualSize,
             )
-
-        self.logger.debug(
-            "Extracted `%d` sections from Portable Executable file `%s`.",
-            count,
-            self.entry,
+            for section in executable.sections
         )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Extracted `%d` sections from Portable Executable file `%s`.",
+                len(sections),
+                self.entry,
+            )
+
+        return sections
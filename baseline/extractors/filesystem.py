@@ -13,15 +13,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import datetime
+import functools
 import hashlib
+import logging
+import math
+import os
 import pathlib
-import sys
+import time
 import typing
-import warnings
 
+import numpy
 import ssdeep
 
+try:
+    import grp
+    import pwd
+
+except ImportError:
+    grp = pwd = None
+
 from baseline import models, schema
 from baseline.extractors import common
 
@@ -30,10 +40,59 @@
     "Hashes",
 )
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# Most entries share a handful of owners, so the user and group databases are only queried once
+# per identifier. These lookups only work when baselining an active system: foreign identifiers
+# (e.g. from a mounted image) raise `KeyError`, in which case the associated fields will be
+# `None` (`null` in JSON).
+#
+@functools.lru_cache(maxsize=None)
+def _get_group_name(gid: int) -> typing.Optional[str]:
+    try:
+        return grp.getgrgid(gid).gr_name if grp else None
+
+    except KeyError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_user_name(uid: int) -> typing.Optional[str]:
+    try:
+        return pwd.getpwuid(uid).pw_name if pwd else None
+
+    except KeyError:
+        return None
+
+
+def _format_timestamp(timestamp: float) -> str:
+    # Equivalent to `datetime.datetime.utcfromtimestamp(timestamp).isoformat()`, including the
+    # rounding of the microseconds, without building intermediate `datetime` objects.
+    #
+    fraction, seconds = math.modf(timestamp)
+    microseconds: int = round(fraction * 1e6)
+
+    if microseconds >= 1000000:
+        seconds += 1
+        microseconds -= 1000000
+
+    elif microseconds < 0:
+        seconds -= 1
+        microseconds += 1000000
+
+    value: time.struct_time = time.gmtime(seconds)
+
+    formatted: str = "%04d-%02d-%02dT%02d:%02d:%02d" % value[:6]
+
+    return f"{formatted}.{microseconds:06d}" if microseconds else formatted
+
 
 class Metadata(models.Extractor):
     """Extracts filesystem-related metadata"""
 
+    __slots__: typing.Tuple[str, ...] = ()
+
     EXTENSION_FILTERS = (r".*",)
     KEY = "fs"
     KINDS = (
@@ -48,65 +107,44 @@ class Metadata(models.Extractor):
         models.Kind.OTHER,
     )
     MAGIC_SIGNATURE_FILTERS = (r".*",)
-    SYSTEM_FILTERS = (r"^Linux$",)
 
     def run(self: object, record: schema.Record) -> None:
-        try:
-            # This only works when baselining an active system. It will return `KeyError` when
-            # baselining a mounted image that contains foreign GIDs for example. In that case, the
-            # associated fields will be `None` (`null` in JSON).
-            group: typing.Optional[str] = self.entry.group()
-
-        except KeyError:
-            group: typing.Optional[str] = None
-
-        try:
-            # This only works when baselining an active system. It will return `KeyError` when
-            # baselining a mounted image that contains foreign GIDs for example. In that case, the
-            # associated fields will be `None` (`null` in JSON).
-            user: typing.Optional[str] = self.entry.owner()
-
-        except KeyError:
-            user: typing.Optional[str] = None
-
-        try:
-            stats = self.entry.stat(
-                follow_symlinks=self.kind != models.Kind.SYMLINK,
-            )
+        # Symbolic links are the only entries for which `stat` and `lstat` differ, and they are
+        # not followed here, so the `lstat` result retrieved while gathering can be reused. Unlike
+        # `pathlib.Path.stat`, `os.stat` supports `follow_symlinks` on every supported version.
+        #
+        stats: os.stat_result = self.stats or os.stat(
+            str(self.entry),
+            follow_symlinks=self.kind != models.Kind.SYMLINK,
+        )
 
-        except TypeError:
-            if sys.version_info >= (3, 10):
-                raise
+        # The location components are derived with plain string operations, which follow the
+        # same rules as `pathlib.PurePath.parent`, `name` and `suffix` without building
+        # intermediate path objects.
+        #
+        location: str = str(self.remap_location(self.entry))
 
-            warnings.warn(
-                "The `follow_symlinks` parameter was only added to `pathlib.Path.stat` in Python "
-                "3.10 so it cannot be used with the current installation of Python ("
-                f"{'.'.join(str(component) for component in sys.version_info[:3])}). Update your "
-                "installation to remove this warning. Falling back to the old way (following all "
-                "symlinks)."
-            )
+        parent, name = os.path.split(location)
 
-            stats = self.entry.stat()
-
-        location = self.remap_location(self.entry)
+        index: int = name.rfind(".")
 
         setattr(
             record,
             self.KEY,
             schema.FilesystemMetadata(
-                extension=location.suffix or None,
-                name=location.name,
+                extension=name[index:] if 0 < index < len(name) - 1 else None,
+                name=name,
                 parent=schema.Parent(
-                    path=str(location.parent),
+                    path=parent,
                 ),
-                path=str(location),
+                path=location,
                 permissions=schema.Permissions(
                     mode=str(oct(stats.st_mode)),
                     ownership=schema.Ownership(
                         gid=stats.st_gid,
-                        group=group,
+                        group=_get_group_name(stats.st_gid),
                         uid=stats.st_uid,
-                        user=user,
+                        user=_get_user_name(stats.st_uid),
                     ),
                 ),
                 size=stats.st_size,
@@ -114,77 +152,65 @@ def run(self: object, record: schema.Record) -> None:
                 if self.kind == models.Kind.SYMLINK
                 else None,
                 timestamps=schema.Timestamps(
-                    atime=datetime.datetime.utcfromtimestamp(stats.st_atime).isoformat(),
-                    ctime=datetime.datetime.utcfromtimestamp(stats.st_ctime).isoformat(),
-                    mtime=datetime.datetime.utcfromtimestamp(stats.st_mtime).isoformat(),
+                    atime=_format_timestamp(stats.st_atime),
+                    ctime=_format_timestamp(stats.st_ctime),
+                    mtime=_format_timestamp(stats.st_mtime),
                 ),
             ),
         )
 
-        self.logger.debug("Extracted filesystem metadata from entry `%s`.", self.entry)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted filesystem metadata from entry `%s`.", self.entry)
 
 
 class Hashes(models.Extractor):
     """Computes several hashes from the entry's data (e.g. MD5, SHA-1, ssdeep)."""
 
+    __slots__: typing.Tuple[str, ...] = ()
+
     EXTENSION_FILTERS = (r".*",)
     KEY = "hash"
     KINDS = (models.Kind.FILE,)
     MAGIC_SIGNATURE_FILTERS = (r".*",)
-    SYSTEM_FILTERS = (r"^Linux$",)
 
     def run(self: object, record: schema.Record) -> None:
-        setattr(
-            record,
-            self.KEY,
-            schema.HashDigests(
-                entropy=self._compute_entropy(self.entry),
-                md5=self._compute_hash(self.entry),
-                sha1=self._compute_hash(self.entry, hash_algorithm="sha1"),
-                sha256=self._compute_hash(self.entry, hash_algorithm="sha256"),
-                ssdeep=self._compute_fuzzy_hash(self.entry),
-            ),
-        )
-
-    def _compute_entropy(self: object, entry: pathlib.Path) -> float:
-        with entry.open("rb") as stream:
-            entropy: float = common.compute_shannon_entropy(stream)
-
-            self.logger.debug("Computed Shannon entropy of file `%s`.", entry)
-
-            return entropy
-
-    def _compute_fuzzy_hash(
-        self: object,
-        entry: pathlib.Path,
-        buffer_size: int = 4096,
-    ) -> str:
-        with entry.open("rb") as stream:
-            cipher = ssdeep.Hash()
-
-            while chunk := stream.read(buffer_size):
-                cipher.update(chunk)
-
-            digest: str = cipher.digest()
-
-            self.logger.debug("Computed `ssdeep` fuzzy hash digest of file `%s`.", entry)
-
-            return digest
+        setattr(record, self.KEY, self._compute_digests(self.entry))
 
-    def _compute_hash(
+    def _compute_digests(
         self: object,
         entry: pathlib.Path,
-        hash_algorithm: str = "md5",
-        buffer_size: int = 4096,
-    ) -> str:
+        buffer_size: int = 65536,
+    ) -> schema.HashDigests:
+        # The file is read only once, and every chunk is fed to all the digests and to the byte
+        # histogram used to compute the entropy. Large files are mapped into memory.
+        #
         with entry.open("rb") as stream:
-            cipher = getattr(hashlib, hash_algorithm)()
-
-            while chunk := stream.read(buffer_size):
-                cipher.update(chunk)
-
-            digest: str = cipher.hexdigest()
-
-            self.logger.debug("Computed `%s` hash digest of file `%s`.", hash_algorithm, entry)
-
-            return digest
+            ciphers: typing.Dict[str, typing.Any] = {
+                hash_algorithm: hashlib.new(hash_algorithm)
+                for hash_algorithm in ("md5", "sha1", "sha256")
+            }
+            fuzzy_cipher = ssdeep.Hash()
+
+            byte_frequencies: numpy.ndarray = numpy.zeros(256, dtype=numpy.int64)
+            size: int = 0
+
+            for chunk in common.iterate_chunks(stream, buffer_size=buffer_size):
+                for cipher in ciphers.values():
+                    cipher.update(chunk)
+
+                # `ssdeep` only accepts `bytes` objects, which views over mapped files are not.
+                fuzzy_cipher.update(bytes(chunk))
+
+                byte_frequencies += common.count_bytes(chunk)
+                size += len(chunk)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Computed hash digests and entropy of file `%s`.", entry)
+
+            return schema.HashDigests(
+                entropy=common.compute_entropy(byte_frequencies, size),
+                md5=ciphers["md5"].hexdigest(),
+                sha1=ciphers["sha1"].hexdigest(),
+                sha256=ciphers["sha256"].hexdigest(),
+                ssdeep=fuzzy_cipher.digest(),
+            )
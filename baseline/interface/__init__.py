@@ -14,18 +14,46 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
+import functools
+import os
 import pathlib
 import platform
 import typing
 
 __all__: list = []
 
-ENVIRONMENT: typing.Dict[str, typing.Any] = {
-    "cwd": pathlib.Path.cwd().resolve(strict=True),
-    "node": platform.node(),
-    "root": pathlib.Path(__file__).resolve(strict=True).parents[2],
-    "timestamp": datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S"),
-}
+
+# The name of the operating system is needed at import time by the platform-specific defaults,
+# so it is looked up on its own rather than through the rest of the environment.
+#
+@functools.lru_cache(maxsize=None)
+def system() -> str:
+    return platform.system()
+
+
+# The environment is only evaluated on first use (and then cached), so that importing the
+# package does not issue any system call.
+#
+@functools.lru_cache(maxsize=None)
+def environment() -> typing.Dict[str, typing.Any]:
+    return {
+        "cache": (
+            pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache")
+            / "baseline"
+        ),
+        "cwd": pathlib.Path.cwd().resolve(strict=True),
+        "node": platform.node(),
+        "root": pathlib.Path(__file__).resolve(strict=True).parents[2],
+        "system": system(),
+        "timestamp": datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S"),
+    }
+
+
+def default_file(extension: str) -> pathlib.Path:
+    return (
+        environment()["cwd"] / f"{environment()['timestamp']}.{environment()['node']}.{extension}"
+    )
+
 
 PLATFORM_SPECIFIC_DEFAULTS: typing.Dict[str, typing.Dict[str, typing.Any]] = {
     "include": {
@@ -46,16 +74,12 @@
         "": [],
     },
     "log_file": {
-        "Linux": (
-            ENVIRONMENT.get("cwd") / f"{ENVIRONMENT['timestamp']}.{ENVIRONMENT['node']}.log"
-        ),
-        "": (ENVIRONMENT.get("cwd") / f"{ENVIRONMENT['timestamp']}.{ENVIRONMENT['node']}.log"),
+        "Linux": functools.partial(default_file, "log"),
+        "": functools.partial(default_file, "log"),
     },
     "output_file": {
-        "Linux": (
-            ENVIRONMENT.get("cwd") / f"{ENVIRONMENT['timestamp']}.{ENVIRONMENT['node']}.ndjson"
-        ),
-        "": (ENVIRONMENT.get("cwd") / f"{ENVIRONMENT['timestamp']}.{ENVIRONMENT['node']}.ndjson"),
+        "Linux": functools.partial(default_file, "ndjson"),
+        "": functools.partial(default_file, "ndjson"),
     },
     "output_file_encoding": {
         "Linux": "utf-8",
@@ -0,0 +1,1090 @@
+# Copyright (C) 2021  sk4la <sk4la.box@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import abc
+import contextlib
+import datetime
+import functools
+import getpass
+import importlib.util
+import io
+import json
+import locale
+import logging
+import logging.config
+import operator
+import os
+import pathlib
+import platform
+import shutil
+import sys
+import time
+import typing
+
+import click
+import click_help_colors
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+import baseline
+from baseline import errors, interface
+
+if typing.TYPE_CHECKING:
+    import jinja2
+    import rich.text
+
+    from baseline import schema
+
+__all__: list = []
+
+# The platform-specific defaults are only looked up once, when the module is first loaded.
+#
+SYSTEM: str = interface.system()
+
+EXCLUDE_DIRECTORY_DEFAULT: typing.List[str] = interface.PLATFORM_SPECIFIC_DEFAULTS[
+    "exclude_directory"
+].get(SYSTEM, [])
+EXCLUDE_EXTRACTOR_DEFAULT: typing.List[str] = interface.PLATFORM_SPECIFIC_DEFAULTS[
+    "exclude_extractor"
+].get(SYSTEM, [])
+INCLUDE_DEFAULT: typing.List[str] = interface.PLATFORM_SPECIFIC_DEFAULTS["include"].get(SYSTEM, [])
+OUTPUT_FILE_DEFAULT: typing.Optional[typing.Callable[[], pathlib.Path]] = (
+    interface.PLATFORM_SPECIFIC_DEFAULTS["output_file"].get(SYSTEM)
+)
+OUTPUT_FILE_ENCODING_DEFAULT: str = interface.PLATFORM_SPECIFIC_DEFAULTS[
+    "output_file_encoding"
+].get(SYSTEM, "utf-8")
+
+COMPRESSION_SUFFIXES: typing.Dict[str, str] = {
+    "xz": ".xz",
+    "zstd": ".zst",
+}
+
+
+def humanize_size(size: int) -> str:
+    units: typing.Tuple[str, ...] = ("bytes", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+    exponent: int = 0
+
+    while exponent < len(units) - 1 and size >= 1024 ** (exponent + 1):
+        exponent += 1
+
+    if exponent == 0:
+        return "1 byte" if size == 1 else f"{size} bytes"
+
+    # Exact multiples are displayed without any decimal part (e.g. `1 KB`).
+    #
+    if size % 1024**exponent == 0:
+        return f"{size // 1024 ** exponent} {units[exponent]}"
+
+    return f"{size / 1024 ** exponent:.1f} {units[exponent]}"
+
+
+def elapsed_since(start_time: int) -> datetime.timedelta:
+    # Durations are measured using the monotonic clock (in nanoseconds), which is not affected
+    # by system clock updates. They are only converted for display.
+    #
+    return datetime.timedelta(microseconds=(time.monotonic_ns() - start_time) // 1000)
+
+
+def total_memory() -> typing.Optional[int]:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def index_mountpoints() -> typing.Dict[pathlib.PurePath, str]:
+    import psutil
+
+    mountpoints: typing.Dict[pathlib.PurePath, str] = {}
+
+    # The first partition listed for a given mountpoint wins, as it used to be.
+    #
+    for mountpoint, filesystem_type in map(
+        operator.itemgetter(*(1, 2)),
+        psutil.disk_partitions(),
+    ):
+        mountpoints.setdefault(pathlib.PurePath(mountpoint), filesystem_type)
+
+    return mountpoints
+
+
+def infer_filesystem_type(
+    location: pathlib.Path,
+    mountpoints: typing.Optional[typing.Mapping[pathlib.PurePath, str]] = None,
+) -> typing.Optional[str]:
+    logger: logging.Logger = logging.getLogger(__name__)
+    logger.debug("Infering filesystem type for location `%s`.", location)
+
+    if mountpoints is None:
+        mountpoints = index_mountpoints()
+
+    # Walking up the parents yields the deepest (i.e. most specific) mountpoint first.
+    #
+    for parent in location.parents:
+        filesystem_type: typing.Optional[str] = mountpoints.get(parent)
+
+        if filesystem_type is not None:
+            return filesystem_type
+
+    return None
+
+
+def resolve_location(location: str, strict: bool = False) -> pathlib.Path:
+    try:
+        return pathlib.Path(location).resolve(strict=strict)
+
+    except FileNotFoundError:
+        raise click.BadParameter(f"Location `{location}` does not exist.")
+
+    except PermissionError:
+        raise click.BadParameter(
+            f"Cannot resolve file `{location}` because of insufficient permissions.",
+        )
+
+    except RuntimeError:
+        raise click.BadParameter(
+            f"Probable infinite loop encountered while resolving entry `{location}`.",
+        )
+
+    except Exception:
+        raise click.BadParameter(
+            f"Unknown system exception raised while resolving entry `{location}`.",
+        )
+
+
+def validate_pairs(
+    _context: click.core.Context,
+    _parameter: click.core.Parameter,
+    values: typing.List[str],
+) -> typing.Dict[pathlib.Path, pathlib.Path]:
+    associations: typing.Dict[pathlib.Path, pathlib.Path] = {}
+
+    for pair in values:
+        key, separator, value = pair.partition(":")
+
+        if not separator:
+            raise click.BadParameter("Pair must be 'key:value' (e.g. '/mnt/usb:/').")
+
+        # Only the source location of a pair needs to exist on the current system.
+        #
+        associations[resolve_location(key, strict=True)] = resolve_location(value)
+
+    return associations
+
+
+class PlatformSpecificDefaults(click.Argument):
+    def process_value(
+        self,
+        context: click.core.Context,
+        value: str,
+    ) -> click.Argument:
+        return super().process_value(
+            context,
+            value or INCLUDE_DEFAULT,
+        )
+
+
+class CountingIter:
+    """Iterator wrapper that counts the items lazily pulled from the underlying iterable."""
+
+    def __init__(self: object, iterable: typing.Iterable[typing.Any]) -> None:
+        self.iterator: typing.Iterator[typing.Any] = iter(iterable)
+        self.count: int = 0
+
+    def __iter__(self: object) -> "CountingIter":
+        return self
+
+    def __next__(self: object) -> typing.Any:
+        item: typing.Any = next(self.iterator)
+
+        self.count += 1
+
+        return item
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that only flushes its buffer when full, on errors and at shutdown."""
+
+    def __init__(
+        self: object,
+        filename: typing.Union[str, pathlib.Path],
+        buffer_size: int = 65536,
+        **kwargs: typing.Any,
+    ) -> None:
+        self.buffer_size: int = buffer_size
+        self.buffered: bool = True
+
+        super().__init__(filename, **kwargs)
+
+        # Worker processes are forked from the current one. The pending records are flushed
+        # beforehand so that they are not duplicated, and the children stop buffering since
+        # they never get the chance to flush when exiting.
+        #
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=self.flush, after_in_child=self.unbuffer)
+
+    def _open(self: object) -> typing.IO[str]:
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def unbuffer(self: object) -> None:
+        self.buffered = False
+
+    def emit(self: object, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+
+        try:
+            self.stream.write(f"{self.format(record)}{self.terminator}")
+
+            if not self.buffered or record.levelno >= logging.ERROR:
+                self.stream.flush()
+
+        except RecursionError:
+            raise
+
+        except Exception:
+            self.handleError(record)
+
+
+@contextlib.contextmanager
+def open_compressed(
+    location: pathlib.Path,
+    compression: str,
+    buffer_size: int = 1048576,
+) -> typing.Iterator[typing.IO[bytes]]:
+    with contextlib.ExitStack() as stack:
+        if compression == "zstd":
+            import zstandard
+
+            # Zstandard compresses using all the available cores, which is usually much faster
+            # than the single-threaded LZMA2 implementation from the standard library.
+            #
+            compressed_stream: typing.IO[bytes] = stack.enter_context(
+                zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(
+                    stack.enter_context(location.open(mode="wb")),
+                    closefd=False,
+                ),
+            )
+
+        else:
+            import lzma
+
+            compressed_stream: typing.IO[bytes] = stack.enter_context(
+                lzma.open(location, mode="wb"),
+            )
+
+        # The compressor is only fed with large chunks, instead of every rendered fragment.
+        #
+        yield stack.enter_context(io.BufferedWriter(compressed_stream, buffer_size=buffer_size))
+
+
+class LazyExtractorChoice(click.Choice):
+    """Choice of extractors that are only imported once the choices are actually needed."""
+
+    def __init__(self: object, case_sensitive: bool = True) -> None:
+        # The parent constructor is bypassed on purpose, since it would consume the choices.
+        #
+        self._choices: typing.Optional[typing.Tuple[str, ...]] = None
+        self.case_sensitive = case_sensitive
+
+    @property
+    def choices(self: object) -> typing.Tuple[str, ...]:
+        if self._choices is None:
+            from baseline import extractors
+
+            self._choices = tuple(
+                dict.fromkeys(extractor.KEY for extractor in extractors.iterate_extractors()),
+            )
+
+        return self._choices
+
+    @choices.setter
+    def choices(self: object, value: typing.Optional[typing.Sequence[str]]) -> None:
+        self._choices = None if value is None else tuple(value)
+
+
+def format_utc_time(moment: datetime.datetime) -> "rich.text.Text":
+    import rich.text
+
+    return rich.text.Text(moment.astimezone(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def serialize_record(record: "schema.Record") -> str:
+    # When `orjson` is available, the records are serialized by its compiled encoder rather than
+    # going through the standard `json` module and the pydantic encoders. The standard `json`
+    # module is set to produce the same compact and unescaped form, so that the output does not
+    # depend on the installed extras.
+    #
+    if orjson is not None:
+        return orjson.dumps(record.dict()).decode()
+
+    return json.dumps(record.dict(), ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=None)
+def load_template_environment() -> "jinja2.Environment":
+    import jinja2
+
+    bytecode_cache: typing.Optional[jinja2.BytecodeCache] = None
+
+    # The compiled templates are also persisted across runs, unless disabled through the
+    # `BASELINE_JINJA_CACHE=0` environment variable (e.g. when editing the templates).
+    #
+    if os.environ.get("BASELINE_JINJA_CACHE", "1") != "0":
+        directory: pathlib.Path = interface.environment()["cache"] / "jinja"
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+
+            bytecode_cache = jinja2.FileSystemBytecodeCache(directory=str(directory))
+
+        except OSError:
+            logging.getLogger(__name__).debug(
+                "Cannot use `%s` as template cache directory. Skipping.",
+                directory,
+            )
+
+    # Templates are loaded relative to the package root. They are compiled once and then kept
+    # around for the whole process, since they never change while running.
+    #
+    environment: jinja2.Environment = jinja2.Environment(
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+        cache_size=-1,
+        loader=jinja2.FileSystemLoader(interface.environment()["root"]),
+    )
+    environment.filters["fastjson"] = serialize_record
+
+    return environment
+
+
+class Renderer(abc.ABC):
+    """Abstract base class that represents a renderer."""
+
+    @property
+    @abc.abstractclassmethod
+    def TEMPLATE(cls: object) -> typing.Union[str, pathlib.Path]:
+        """Class property that points the Jinja template to use."""
+
+    def __init__(self: object) -> None:
+        self.template = self.read_template()
+
+    def read_template(self: object) -> "jinja2.Template":
+        """Reads Jinja template content. Paths are relative to the package root."""
+
+        return load_template_environment().get_template(pathlib.PurePath(self.TEMPLATE).as_posix())
+
+    def render(
+        self: object,
+        **components: typing.Any,
+    ) -> str:
+        """Renders the templated file using the given components."""
+
+        return self.template.render(**components)
+
+    def dump(
+        self: object,
+        stream: typing.IO[typing.Any],
+        encoding: typing.Optional[str] = None,
+        buffer_size: int = 128,
+        **components: typing.Any,
+    ) -> None:
+        """Renders the templated file into a stream, without materializing the whole output."""
+
+        template_stream: "jinja2.environment.TemplateStream" = self.template.stream(**components)
+        template_stream.enable_buffering(buffer_size)
+        template_stream.dump(stream, encoding=encoding)
+
+
+class HtmlRenderer(Renderer):
+    TEMPLATE = pathlib.Path("templates", "html.jinja")
+
+
+class NdjsonRenderer(Renderer):
+    TEMPLATE = pathlib.Path("templates", "ndjson.jinja")
+
+
+@click.command(
+    cls=click_help_colors.HelpColorsCommand,
+    context_settings={
+        "max_content_width": 100,
+    },
+    help="Creates a new filesystem-based baseline.",
+    help_headers_color="yellow",
+    help_options_color="green",
+    name="new",
+    options_metavar="<options>",
+)
+@click.argument(
+    "include",
+    cls=PlatformSpecificDefaults,
+    metavar="<path>...",
+    nargs=-1,
+    required=False,
+    type=click.Path(
+        exists=True,
+        resolve_path=True,
+        allow_dash=True,
+        path_type=pathlib.Path,
+    ),
+)
+@click.option(
+    "--comment",
+    help="Add an arbitrary comment to the generated output file.",
+    metavar="<str>",
+)
+@click.option(
+    "--compression",
+    default="xz",
+    help=(
+        "Set the compression algorithm of the results. The `zstd` algorithm requires the "
+        "optional `zstandard` package."
+    ),
+    show_default=True,
+    type=click.Choice(
+        ["none", "xz", "zstd"],
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "--exclude-directory",
+    default=EXCLUDE_DIRECTORY_DEFAULT,
+    help=(
+        "Exclude a specific directory from the baseline. Can be specified "
+        "multiple times (e.g. `--exclude-directory /dev --exclude-directory "
+        "/proc`)."
+    ),
+    metavar="<directory>...",
+    multiple=True,
+    type=click.Path(
+        file_okay=False,
+        exists=True,
+        resolve_path=True,
+        allow_dash=True,
+        path_type=pathlib.Path,
+    ),
+)
+@click.option(
+    "--exclude-extractor",
+    default=EXCLUDE_EXTRACTOR_DEFAULT,
+    help=(
+        "Exclude extractors. Can be specified multiple times (e.g. `--exclude-extractor hash "
+        "--exclude-extractor pe`)."
+    ),
+    multiple=True,
+    type=LazyExtractorChoice(case_sensitive=False),
+    show_default=True,
+)
+@click.option(
+    "--max-size",
+    default=5000000,
+    help="Set the maximum file size (in bytes) to inspect.",
+    metavar="<int>",
+    show_default=True,
+    type=click.IntRange(1),
+)
+@click.option(
+    "-o",
+    "--output-file",
+    help="Set the output file path (e.g. 'baseline.ndjson').",
+    default=OUTPUT_FILE_DEFAULT,
+    metavar="<file>",
+    show_default="<timestamp>.<computer name>.ndjson",
+    type=click.Path(
+        dir_okay=False,
+        resolve_path=True,
+        allow_dash=True,
+        path_type=pathlib.Path,
+    ),
+)
+@click.option(
+    "--output-file-encoding",
+    default=OUTPUT_FILE_ENCODING_DEFAULT,
+    help="Set the output file encoding. Only applies when writing to an actual file.",
+    show_default=True,
+    type=click.Choice(
+        interface.SUPPORTED_ENCODINGS,
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "-f",
+    "--output-format",
+    default="ndjson",
+    help="Set the output format.",
+    show_default=True,
+    type=click.Choice(
+        ["html", "ndjson"],
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "--partition-size",
+    help=(
+        "Set the partition size (i.e. number of entries per process). Defaults to a size "
+        "adapted to the number of gathered entries and processes."
+    ),
+    metavar="<int>",
+    type=click.IntRange(1),
+)
+@click.option(
+    "--processes",
+    default=os.cpu_count(),
+    help="Set the number of parallel processes.",
+    metavar="<int>",
+    show_default=True,
+    type=click.IntRange(1),
+)
+@click.option(
+    "--recursive/--non-recursive",
+    default=True,
+    help=(
+        "Whether to walk the filesystem recursively. When set, the program will only inspect the "
+        "files and directories specifies on the first level of any included path. For example, if "
+        "'/mnt/image' is specified as an included path, then only the directory '/mnt/image' "
+        "itself and its direct children will be inspected."
+    ),
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--remap",
+    callback=validate_pairs,
+    help=(
+        "Artificially remap included paths (e.g. '/mnt/image:/'). Can be specified multiple times "
+        "(e.g. `--remap /mnt/image:/ --remap /dev/null:/dev/void`)."
+    ),
+    metavar="<key:value>...",
+    multiple=True,
+    type=click.UNPROCESSED,
+)
+@click.option(
+    "--report/--no-report",
+    default=True,
+    help="Whether to show a final report at the end.",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--skip-compression",
+    help="Whether to skip compression of the results (same as `--compression none`).",
+    is_flag=True,
+)
+@click.option(
+    "--skip-directories",
+    help="Whether to skip directories.",
+    is_flag=True,
+)
+@click.option(
+    "--skip-empty",
+    help="Whether to skip empty entries.",
+    is_flag=True,
+)
+@click.pass_context
+def create_baseline(
+    context: click.core.Context,
+    comment,
+    compression,
+    exclude_directory,
+    exclude_extractor,
+    include,
+    max_size,
+    recursive,
+    output_file,
+    output_file_encoding,
+    output_format,
+    partition_size,
+    processes,
+    skip_compression,
+    skip_directories,
+    skip_empty,
+    remap,
+    report,
+) -> None:
+    # The heaviest dependencies are only imported once a command actually runs, so that the
+    # `--help` and `--version` options do not pay for them.
+    #
+    import rich
+
+    from baseline import core
+
+    if skip_compression:
+        compression = "none"
+
+    if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        raise click.BadParameter(
+            "The `zstandard` package is required for `zstd` compression.",
+            param_hint="'--compression'",
+        )
+
+    log_file: str = context.obj.get("log_file", f"{baseline.__package__}.log")
+    monochrome: bool = context.obj.get("monochrome", False)
+    verbose: int = context.obj.get("verbose", 0)
+
+    logger: logging.Logger = logging.getLogger(baseline.__name__)
+
+    # Logging needs to be initialized at the very beginning
+    # in order to display the earliest messages if needed.
+    #
+    if logging_configuration := context.obj.get("logging_configuration"):
+        try:
+            with logging_configuration.open() as stream:
+                try:
+                    configuration: typing.Dict[str, typing.Any] = json.load(stream)
+
+                    logging.config.dictConfig(configuration)
+
+                    logger.debug(
+                        "Initialized logging using the configuration from file `%s`.",
+                        logging_configuration,
+                    )
+
+                    if verbose > 0:
+                        logger.warning(
+                            "Verbosity overriden by the current logging configuration. The "
+                            "`--verbose` flag is always ignored when using "
+                            "`--logging-configuration`.",
+                        )
+
+                    if monochrome:
+                        logger.warning(
+                            "Monochromatism overriden by the current logging configuration. The "
+                            "`--monochrome` flag is always ignored when using "
+                            "`--logging-configuration`.",
+                        )
+
+                except json.JSONDecodeError as exception:
+                    logger.exception(
+                        "Failed to initialize the main logger using the configuration from `%s`.",
+                        logging_configuration,
+                    )
+
+                    raise errors.GenericError(
+                        "failed to initialize logger using the configuration from "
+                        f"`{logging_configuration}`",
+                    ) from exception
+
+        except PermissionError as exception:
+            logger.warning(
+                "Failed to read from file `%s` because of insufficient permissions.",
+                logging_configuration,
+            )
+
+            raise errors.GenericError(
+                f"failed to read from `{logging_configuration}`",
+            ) from exception
+
+        except RuntimeError as exception:
+            logger.error(
+                "Probable infinite loop encountered while reading from file `%s`.",
+                logging_configuration,
+            )
+
+            raise errors.GenericError(
+                f"failed to read from `{logging_configuration}`",
+            ) from exception
+
+        except Exception as exception:
+            logger.exception(
+                "Unknown system exception raised while reading from file `%s`.",
+                logging_configuration,
+            )
+
+            raise errors.GenericError(
+                f"failed to read from `{logging_configuration}`",
+            ) from exception
+
+    else:
+        formatter: logging.Formatter = logging.Formatter(
+            "%(asctime)s %(levelname)-8s %(name)-24s %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S %Z",
+        )
+
+        # Timestamps default to UTC instead of the local time. Only the built-in formatters are
+        # affected, rather than monkey patching `logging.Formatter` globally.
+        #
+        formatter.converter = time.gmtime
+
+        # The logging level of the console handler is set according to the verbosity level the
+        # user asked for.
+        #
+        console_level: int = {
+            0: logging.CRITICAL,
+            1: logging.ERROR,
+            2: logging.WARNING,
+            3: logging.INFO,
+            4: logging.DEBUG,
+        }.get(verbose, logging.DEBUG)
+
+        # Rich is only worth setting up when the console actually displays some records, which is
+        # not the case by default.
+        #
+        if console_level < logging.CRITICAL and not monochrome and sys.__stdin__.isatty():
+            import rich.logging
+
+            console_handler: logging.Handler = rich.logging.RichHandler(
+                level=console_level,
+                log_time_format=format_utc_time,
+                omit_repeated_times=False,
+                rich_tracebacks=True,
+            )
+
+        else:
+            console_handler: logging.Handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            console_handler.setLevel(console_level)
+
+        # The records are buffered on their way to the log file, which is flushed by
+        # `logging.shutdown` when exiting.
+        #
+        file_handler: logging.FileHandler = BufferedFileHandler(filename=log_file)
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(logging.DEBUG)
+
+        logger: logging.Logger = logging.getLogger(baseline.__package__)
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        logger.setLevel(logging.DEBUG)
+
+        logger.debug("Initialized logging using the built-in configuration.")
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    disk_usage = shutil.disk_usage(output_file.parent)
+
+    if disk_usage.free < 209715200:
+        logger.warning(
+            "Disk space is very low (%s). Be aware that the resulting file can become quite big, "
+            "depending on the number of entries that need to be processed.",
+            humanize_size(disk_usage.free),
+        )
+
+    # Log several system informations in order to improve later debugging procedures. They are
+    # all gathered into a single record, and only when it would actually be emitted.
+    #
+    if logger.isEnabledFor(logging.INFO):
+        import psutil
+
+        # The partitions are only listed once for all the included locations.
+        #
+        mountpoints: typing.Dict[pathlib.PurePath, str] = index_mountpoints()
+
+        # The memory size is directly queried from the system where possible, since `psutil`
+        # needs to parse `/proc` for it.
+        #
+        memory: typing.Optional[int] = total_memory()
+
+        informations: typing.List[typing.Tuple[str, typing.Any]] = [
+            ("Included Locations", ", ".join(str(location) for location in include)),
+            ("Excluded Locations", ", ".join(str(location) for location in exclude_directory)),
+            ("Log File", log_file),
+            ("Output File", output_file),
+            ("Output File Format", output_format),
+            ("Console Verbosity Level", verbose),
+            (
+                "File System Type",
+                ", ".join(
+                    filter(
+                        functools.partial(operator.is_not, None),
+                        (infer_filesystem_type(location, mountpoints) for location in include),
+                    ),
+                ),
+            ),
+            ("Program Version", baseline.__version__),
+            ("Operating System", SYSTEM),
+            (
+                "CPU Cores",
+                f"{os.cpu_count()} ({psutil.cpu_count(logical=False)} physical cores)",
+            ),
+            (
+                "Volatile Memory",
+                humanize_size(psutil.virtual_memory().total if memory is None else memory),
+            ),
+            (
+                "Disk Usage",
+                f"{int(disk_usage.used / (disk_usage.used + disk_usage.free) * 100)}%",
+            ),
+            ("Language", ".".join(locale.getdefaultlocale())),
+            ("System Timezone", datetime.datetime.now().astimezone().tzname()),
+            ("Processor Architecture", platform.machine()),
+            ("Computer Name", interface.environment()["node"]),
+            ("Username", getpass.getuser()),
+            ("Effective User Identifier", os.geteuid()),
+            ("Effective Command Line", " ".join(sys.argv)),
+            (
+                "Excluded Extractors",
+                ", ".join(sorted(str(extractor) for extractor in exclude_extractor)),
+            ),
+            ("Current Working Directory", interface.environment()["cwd"]),
+        ]
+
+        logger.info(
+            "%s",
+            "\n".join(f"{label:<25} : {value}" for label, value in informations),
+        )
+
+    start_time: int = time.monotonic_ns()
+
+    try:
+        with core.Baseline(
+            comment=comment,
+            exclude_directory=exclude_directory,
+            exclude_extractor=exclude_extractor,
+            max_size=max_size,
+            partition_size=partition_size,
+            processes=processes,
+            recursive=recursive,
+            skip_compression=compression == "none",
+            skip_directories=skip_directories,
+            skip_empty=skip_empty,
+            remap=remap,
+        ) as executor:
+
+            # The results are lazily consumed by the template while it is streamed to the output
+            # file, so that they never need to be held in memory all at once. The records are
+            # counted along the way for the final report.
+            results: CountingIter = CountingIter(executor.compute(*include))
+
+            # Only the renderer of the requested output format is instantiated.
+            renderer: Renderer = {
+                "html": HtmlRenderer,
+                "ndjson": NdjsonRenderer,
+            }[output_format]()
+
+            components = {
+                "title": baseline.__package__.capitalize(),
+                "computer_name": interface.environment()["node"],
+                "records": results,
+            }
+
+            if compression == "none":
+                logger.warning(
+                    "Skipping compression of the results as requested. Be aware that the "
+                    "resulting file can become quite big, depending on the number of entries "
+                    "that need to be processed.",
+                )
+                logger.debug("Writing the results to `%s`.", output_file)
+
+            else:
+                output_file: pathlib.Path = output_file.with_suffix(
+                    f"{output_file.suffix}{COMPRESSION_SUFFIXES[compression]}",
+                )
+
+                logger.debug("Compressing and writing the results to `%s`.", output_file)
+
+            with contextlib.ExitStack() as stack:
+                # Only the opening of the output file is handled here. The exceptions raised by
+                # the analysis while the records are being written are left to the outer handlers.
+                #
+                try:
+                    stream: typing.IO = stack.enter_context(
+                        (
+                            output_file.open(mode="w", encoding=output_file_encoding)
+                            if compression == "none"
+                            else open_compressed(output_file, compression)
+                        ),
+                    )
+
+                except PermissionError:
+                    logger.error(
+                        "Failed to open file `%s` for writing because of insufficient "
+                        "permissions.",
+                        output_file,
+                    )
+
+                    sys.exit(os.EX_SOFTWARE)
+
+                except RuntimeError:
+                    logger.error(
+                        "Probable infinite loop encountered while opening file `%s` for writing.",
+                        output_file,
+                    )
+
+                    sys.exit(os.EX_SOFTWARE)
+
+                except Exception:
+                    logger.exception(
+                        "Unknown system exception raised while opening file `%s` for writing.",
+                        output_file,
+                    )
+
+                    sys.exit(os.EX_SOFTWARE)
+
+                try:
+                    renderer.dump(
+                        stream,
+                        encoding=None if compression == "none" else output_file_encoding,
+                        **components,
+                    )
+
+                except BaseException:
+                    # A truncated output file would be mistaken for a complete baseline.
+                    #
+                    stack.close()
+
+                    output_file.unlink(missing_ok=True)
+
+                    logger.error("Removed the incomplete output file `%s`.", output_file)
+
+                    raise
+
+            duration: datetime.timedelta = elapsed_since(start_time)
+
+            total_size = output_file.stat().st_size
+
+            logger.info("Written `%d` bytes of results to `%s`.", total_size, output_file)
+            logger.info("Finished in `%s`.", duration)
+
+            if report:
+                rich.print("[bold green]All done![/bold green] :muscle:\n")
+                rich.print(f"Entries Processed : {results.count}")
+                rich.print(f"Output Format     : {output_format}")
+                rich.print(f"Output File       : {output_file}")
+                rich.print(f"Size              : {humanize_size(total_size)}")
+                rich.print(f"Total Time        : {duration}")
+
+    except KeyboardInterrupt:
+        logger.warning(
+            "Process pool shut down. Exiting now after `%s`.",
+            elapsed_since(start_time),
+        )
+
+        sys.exit(os.EX_SOFTWARE)
+
+    except errors.ValidationError as exception:
+        logger.critical(
+            "Validation error in the `%s.core.%s` class attributes `%s`.",
+            baseline.__package__,
+            core.Baseline.__name__,
+            ", ".join(exception.context.get("parameters", [])),
+        )
+
+        sys.exit(os.EX_SOFTWARE)
+
+    except errors.GenericError:
+        logger.exception(
+            "Unrecoverable failure occurred. Exiting now after `%s`.",
+            elapsed_since(start_time),
+        )
+
+        raise
+
+
+@click.command(
+    cls=click_help_colors.HelpColorsCommand,
+    context_settings={
+        "max_content_width": 100,
+    },
+    help="Show the JSON representation of the actual schema.",
+    help_headers_color="yellow",
+    help_options_color="green",
+    name="schema",
+    options_metavar="<options>",
+)
+@click.option(
+    "--compact",
+    help="Render compact JSON instead of the default idented version.",
+    is_flag=True,
+)
+@click.option(
+    "--output-file",
+    help="Set the output file path (e.g. 'schema.json').",
+    metavar="<file>",
+    type=click.Path(
+        dir_okay=False,
+        writable=True,
+        readable=False,
+        resolve_path=True,
+        allow_dash=True,
+        path_type=pathlib.Path,
+    ),
+)
+@click.option(
+    "--output-file-encoding",
+    default=OUTPUT_FILE_ENCODING_DEFAULT,
+    help="Set the output file encoding. Only applies when writing to an actual file.",
+    show_default=True,
+    type=click.Choice(
+        interface.SUPPORTED_ENCODINGS,
+        case_sensitive=False,
+    ),
+)
+@click.pass_context
+def print_schema(
+    context: click.core.Context,
+    output_file,
+    output_file_encoding,
+    compact,
+) -> None:
+    import pydantic.schema
+    import rich
+
+    from baseline import schema
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    output: str = json.dumps(
+        pydantic.schema.model_schema(schema.Record),
+        indent=2 if not compact else None,
+    )
+
+    if output_file:
+        try:
+            with output_file.open("w", encoding=output_file_encoding) as stream:
+                stream.write(output + "\n")
+
+        except PermissionError as exception:
+            logger.error(
+                "Failed to open file `%s` for writing because of insufficient permissions.",
+                output_file,
+            )
+
+            raise errors.GenericError(
+                f"cannot open file `{output_file}` because of insufficient permissions",
+            ) from exception
+
+        except RuntimeError as exception:
+            logger.error(
+                "Probable infinite loop encountered while opening file `%s` for writing.",
+                output_file,
+            )
+
+            raise errors.GenericError(f"failed to open file `{output_file}`") from exception
+
+        except Exception as exception:
+            logger.exception(
+                "Unknown system exception raised while opening file `%s` for writing.",
+                output_file,
+            )
+
+            raise errors.GenericError(f"failed to open file `{output_file}`") from exception
+
+    elif context.obj.get("monochrome", False):
+        sys.stdout.write(output + "\n")
+
+    else:
+        rich.print_json(output, indent=2 if not compact else None)
@@ -15,12 +15,21 @@
 
 import abc
 import enum
+import functools
 import logging
+import os
 import pathlib
 import platform
 import re
+import types
 import typing
 
+try:
+    import re2
+
+except ImportError:
+    re2 = None
+
 from baseline import errors, schema
 
 __all__: typing.Tuple[str, ...] = (
@@ -28,9 +37,16 @@
     "Kind",
 )
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The name of the current operating system cannot change while running.
+_SYSTEM: str = platform.system()
 
+
+# Kinds are plain integers, which are cheaper to compare, hash and pickle than strings.
+#
 @enum.unique
-class Kind(str, enum.Enum):
+class Kind(enum.IntEnum):
     FILE: int = enum.auto()
     DIRECTORY: int = enum.auto()
     SYMLINK: int = enum.auto()
@@ -42,12 +58,88 @@ class Kind(str, enum.Enum):
     OTHER: int = enum.auto()
 
     def __str__(self):
-        return self.name.lower()
+        return _KIND_NAMES[self]
+
+
+# The lower-case names of the kinds, indexed by their value. They are rendered for every
+# record, so they are only computed once.
+#
+_KIND_NAMES: typing.Tuple[str, ...] = ("",) + tuple(kind.name.lower() for kind in Kind)
+
+
+def _compile_union(
+    patterns: typing.Iterable[str],
+    anchored: bool = False,
+) -> typing.Optional[typing.Pattern[str]]:
+    alternatives: typing.List[str] = [f"(?:{pattern})" for pattern in patterns]
+
+    if not alternatives:
+        return None
+
+    # When `re2` is available, the union is compiled to an automaton whose matching time does not
+    # depend on the number of alternatives. Patterns that it cannot handle (e.g. lookarounds or
+    # backreferences) are left to the `re` module. Anchored patterns must match the whole string,
+    # not only its beginning, though both modules do not spell the end of string the same way.
+    #
+    if re2 is not None:
+        try:
+            return re2.compile(
+                f"(?:{'|'.join(alternatives)})\\z" if anchored else "|".join(alternatives),
+            )
+
+        except re2.error:
+            pass
+
+    return re.compile(f"(?:{'|'.join(alternatives)})\\Z" if anchored else "|".join(alternatives))
+
+
+def _parse_literal(pattern: str) -> typing.Optional[str]:
+    # Matches anchored patterns such as `\.exe`, which only ever match a single literal string.
+    #
+    body: str = pattern[1:] if pattern.startswith("^") else pattern
+
+    if body.endswith("$") and not body.endswith("\\$"):
+        body = body[:-1]
+
+    literal: str = re.sub(r"\\(.)", r"\1", body)
+
+    return literal if re.escape(literal) == body else None
+
+
+_EMPTY_REMAP: typing.Mapping[pathlib.Path, pathlib.Path] = types.MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=None)
+def _prepare_remap(
+    remap: typing.Tuple[typing.Tuple[pathlib.Path, pathlib.Path], ...],
+) -> typing.Tuple[typing.Tuple[typing.Tuple[str, ...], pathlib.Path], ...]:
+    # The sources are sorted from the deepest to the shallowest, so that the first source that
+    # prefixes a location is also the longest one.
+    #
+    return tuple(
+        sorted(
+            ((source.parts, destination) for source, destination in remap),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        ),
+    )
 
 
 class Extractor(abc.ABC):
     """Abstract class used to derive all extractors."""
 
+    # An extractor is instantiated for every entry, so its instances do without a `__dict__`.
+    # Subclasses need to declare their own `__slots__` as well (even empty) for this to hold.
+    #
+    __slots__: typing.Tuple[str, ...] = (
+        "entry",
+        "kind",
+        "logger",
+        "prepared_remap",
+        "remap",
+        "stats",
+    )
+
     EXTENSION_FILTERS: typing.Tuple[str, ...] = tuple()
     KINDS: typing.Tuple[int, ...] = (
         Kind.FILE,
@@ -63,15 +155,61 @@ class Extractor(abc.ABC):
     MAGIC_SIGNATURE_FILTERS: typing.Tuple[str, ...] = tuple()
     SYSTEM_FILTERS: typing.Tuple[str, ...] = tuple()
 
+    # Compiled counterparts of the filters above (or `None` when there is no filter), set for
+    # every subclass. Literal extensions are kept apart, in a set.
+    _EXTENSION_LITERALS: typing.FrozenSet[str] = frozenset()
+    _EXTENSION_PATTERN: typing.Optional[typing.Pattern[str]] = None
+    _MAGIC_SIGNATURE_PATTERN: typing.Optional[typing.Pattern[str]] = None
+    _SYSTEM_PATTERN: typing.Optional[typing.Pattern[str]] = None
+
+    # Whether the extractor is compatible with the current system, set for every subclass.
+    _COMPATIBLE: bool = False
+
+    # Bitmask of the supported kinds (i.e. bit `n` is set when kind `n` is supported), set for
+    # every subclass.
+    _KINDS_MASK: int = 0
+
+    def __init_subclass__(cls: object, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # The filters are compiled once, when the extractor class is defined, rather than being
+        # looked up from the `re` cache for every entry. The alternatives of a given filter are
+        # fused into a single pattern, so that only one match is attempted per filter. Extension
+        # and system filters must match the whole string, whereas magic signature filters only
+        # match the beginning of the (much longer) signature.
+        #
+        literals: typing.Dict[str, typing.Optional[str]] = {
+            pattern: _parse_literal(pattern) for pattern in cls.EXTENSION_FILTERS
+        }
+
+        cls._EXTENSION_LITERALS = frozenset(
+            literal for literal in literals.values() if literal is not None
+        )
+        cls._EXTENSION_PATTERN = _compile_union(
+            (pattern for pattern, literal in literals.items() if literal is None),
+            anchored=True,
+        )
+        cls._MAGIC_SIGNATURE_PATTERN = _compile_union(cls.MAGIC_SIGNATURE_FILTERS)
+        cls._SYSTEM_PATTERN = _compile_union(cls.SYSTEM_FILTERS, anchored=True)
+
+        # The current system never changes while running, so the compatibility of the extractor
+        # is evaluated once and for all. Extractors without system filters run everywhere.
+        #
+        cls._COMPATIBLE = cls._SYSTEM_PATTERN is None or bool(cls._SYSTEM_PATTERN.match(_SYSTEM))
+
+        cls._KINDS_MASK = 0
+
+        for kind in cls.KINDS:
+            cls._KINDS_MASK |= 1 << kind
+
     @property
     @abc.abstractmethod
     def KEY(self) -> str:
         ...
 
-    @property
     @classmethod
     def is_compatible(cls: object) -> bool:
-        return any(re.match(pattern, platform.system()) for pattern in cls.SYSTEM_FILTERS)
+        return cls._COMPATIBLE
 
     @classmethod
     def supports(
@@ -79,40 +217,58 @@ def supports(
         entry: pathlib.Path,
         kind: int = Kind.FILE,
         magic_signature: typing.Optional[str] = None,
+        suffix: typing.Optional[str] = None,
     ) -> bool:
-        if kind not in cls.KINDS:
+        if not (cls._KINDS_MASK >> kind) & 1:
             return False
 
-        filters: typing.List[bool] = [
-            any(re.match(pattern, entry.suffix) for pattern in cls.EXTENSION_FILTERS),
-        ]
+        # The suffix can be passed when already known, so that it is only derived once from the
+        # entry for all the extractors.
+        #
+        if suffix is None:
+            suffix = entry.suffix
 
-        if magic_signature:
-            filters.append(
-                any(re.match(pattern, magic_signature) for pattern in cls.MAGIC_SIGNATURE_FILTERS),
-            )
+        if suffix in cls._EXTENSION_LITERALS:
+            return True
+
+        if cls._EXTENSION_PATTERN is not None and cls._EXTENSION_PATTERN.match(suffix):
+            return True
 
-        return any(filters)
+        return bool(
+            magic_signature
+            and cls._MAGIC_SIGNATURE_PATTERN is not None
+            and cls._MAGIC_SIGNATURE_PATTERN.match(magic_signature),
+        )
 
     def __init__(
         self: object,
         entry: pathlib.Path,
         kind: typing.Optional[int] = Kind.FILE,
-        remap: typing.Dict[pathlib.Path, pathlib.Path] = {},
+        remap: typing.Optional[typing.Mapping[pathlib.Path, pathlib.Path]] = None,
+        stats: typing.Optional[os.stat_result] = None,
     ) -> None:
-        self.logger: logging.Logger = logging.getLogger(__name__)
+        # The module logger is shared by all the extractors, instead of being looked up every
+        # time an entry gets processed.
+        self.logger: logging.Logger = logger
 
         self.entry: pathlib.Path = entry
         self.kind: typing.Optional[int] = kind
-        self.remap: typing.Dict[pathlib.Path, pathlib.Path] = remap
+        self.remap: typing.Mapping[pathlib.Path, pathlib.Path] = remap or _EMPTY_REMAP
+
+        # The remap is only prepared once for a given mapping, then shared by all extractors.
+        self.prepared_remap: typing.Tuple[
+            typing.Tuple[typing.Tuple[str, ...], pathlib.Path], ...
+        ] = _prepare_remap(tuple(self.remap.items()))
+
+        # The `lstat` result of the entry, when it has already been retrieved while gathering.
+        self.stats: typing.Optional[os.stat_result] = stats
 
     def remap_location(self: object, location: pathlib.Path) -> pathlib.Path:
-        for source, destination in self.remap.items():
-            try:
-                location: pathlib.Path = destination / location.relative_to(source)
+        parts: typing.Tuple[str, ...] = location.parts
 
-            except ValueError:
-                pass
+        for source_parts, destination in self.prepared_remap:
+            if parts[: len(source_parts)] == source_parts:
+                return destination.joinpath(*parts[len(source_parts) :])
 
         return location
 
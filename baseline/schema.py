@@ -35,7 +35,15 @@
 )
 
 
-class HashDigests(pydantic.BaseModel):
+class _Model(pydantic.BaseModel):
+    class Config:
+        # Nested models are always freshly built by the extractors, so they do not need to be
+        # copied again when validated as part of their parent model.
+        #
+        copy_on_model_validation: str = "none"
+
+
+class HashDigests(_Model):
     entropy: pydantic.confloat(ge=0.0)
     md5: str
     sha1: str
@@ -43,29 +51,29 @@ class HashDigests(pydantic.BaseModel):
     ssdeep: str
 
 
-class Ownership(pydantic.BaseModel):
+class Ownership(_Model):
     gid: typing.Optional[pydantic.conint(ge=0)]
     group: typing.Optional[str]
     uid: typing.Optional[pydantic.conint(ge=0)]
     user: typing.Optional[str]
 
 
-class Parent(pydantic.BaseModel):
+class Parent(_Model):
     path: typing.Optional[str]
 
 
-class Permissions(pydantic.BaseModel):
+class Permissions(_Model):
     mode: typing.Optional[str]
     ownership: typing.Optional[Ownership]
 
 
-class Timestamps(pydantic.BaseModel):
+class Timestamps(_Model):
     atime: typing.Optional[str]
     ctime: typing.Optional[str]
     mtime: typing.Optional[str]
 
 
-class FilesystemMetadata(pydantic.BaseModel):
+class FilesystemMetadata(_Model):
     path: typing.Optional[str]
     name: typing.Optional[str]
     extension: typing.Optional[str]
@@ -76,39 +84,57 @@ class FilesystemMetadata(pydantic.BaseModel):
     timestamps: typing.Optional[Timestamps]
 
 
-class PortableExecutableSection(pydantic.BaseModel):
+class PortableExecutableSection(_Model):
     entropy: typing.Optional[pydantic.confloat(ge=0.0)]
     name: typing.Optional[str]
     psize: typing.Optional[pydantic.conint(ge=0)]
     vsize: typing.Optional[pydantic.conint(ge=0)]
 
 
-class PortableExecutableResource(pydantic.BaseModel):
+class PortableExecutableResource(_Model):
     identifier: typing.Optional[pydantic.PositiveInt]
     name: typing.Optional[str]
 
 
-class PortableExecutable(pydantic.BaseModel):
-    exports: typing.Optional[typing.List[str]]
-    imports: typing.Optional[typing.List[str]]
-    sections: typing.Optional[typing.List[PortableExecutableSection]]
+# Tuples are smaller than lists and are built by the extractor in one go.
+#
+class PortableExecutable(_Model):
+    exports: typing.Optional[typing.Tuple[str, ...]]
+    imports: typing.Optional[typing.Tuple[str, ...]]
+    sections: typing.Optional[typing.Tuple[PortableExecutableSection, ...]]
 
 
-class Signature(pydantic.BaseModel):
+class Signature(_Model):
     kind: str
     magic: typing.Optional[str]
     mime: typing.Optional[str]
 
 
-class Version(pydantic.BaseModel):
+class Version(_Model):
     package: typing.Optional[str] = baseline.__version__
     model: typing.Optional[str] = baseline.SCHEMA_VERSION
 
 
-class Record(pydantic.BaseModel):
+class Record(_Model):
+    class Config:
+        @staticmethod
+        def schema_extra(schema: typing.Dict[str, typing.Any], _model: type) -> None:
+            # The default version is built by a factory (see below), so it needs to be added
+            # back to the schema, as it would otherwise be missing.
+            #
+            properties: typing.Dict[str, typing.Any] = schema["properties"]
+            properties["version"] = {
+                "title": "Version",
+                "default": Version().dict(),
+                "allOf": [properties["version"]],
+            }
+
     comment: typing.Optional[str]
     signature: Signature
-    version: Version = Version()
+
+    # Pydantic deep copies model defaults for every record, which is much more expensive than
+    # building a new version object.
+    version: Version = pydantic.Field(default_factory=Version)
     fs: typing.Optional[FilesystemMetadata]
     hash: typing.Optional[HashDigests]
     pe: typing.Optional[PortableExecutable]